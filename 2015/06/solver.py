@@ -1,3 +1,4 @@
+from array import array
 from dataclasses import dataclass
 from typing import Callable, Self
 
@@ -35,7 +36,7 @@ class Direction:
             end=PointHelper.parse(values[-1]),
         )
 
-    def apply(self, grid: list[int], actions: Actions) -> None:
+    def apply(self, grid: bytearray | array[int], actions: Actions) -> None:
         for x in range(self.start[0], self.end[0] + 1):
             for y in range(self.start[1], self.end[1] + 1):
                 index = (x * 1_000) + y
@@ -44,16 +45,15 @@ class Direction:
 
 @answer.timer
 def main() -> None:
-    directions = [Direction.new(line) for line in Parser().lines()]
-    answer.part1(400410, apply_all(directions, SINGLE))
-    answer.part2(15343601, apply_all(directions, DIMABLE))
-
-
-def apply_all(directions: list[Direction], actions: Actions) -> int:
-    grid: list[int] = [0] * 1_000_000
-    for direction in directions:
-        direction.apply(grid, actions)
-    return sum(grid)
+    # both grids are alive at once, a byte / 2 bytes per light instead of a pointer
+    single = bytearray(1_000_000)
+    dimable = array("H", bytes(2_000_000))
+    for line in Parser().iter_lines():
+        direction = Direction.new(line)
+        direction.apply(single, SINGLE)
+        direction.apply(dimable, DIMABLE)
+    answer.part1(400410, sum(single))
+    answer.part2(15343601, sum(dimable))
 
 
 if __name__ == "__main__":
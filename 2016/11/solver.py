@@ -99,12 +99,11 @@ def main() -> None:
         floors.append(Floor.new(line))
     floors.append(Floor(0, 0))
 
-    part1 = count_steps(floors)
+    with answer.phase(1):
+        answer.part1(37, count_steps(floors))
     floors[0] += Floor(2, 2)
-    part2 = count_steps(floors)
-
-    answer.part1(37, part1)
-    answer.part2(61, part2)
+    with answer.phase(2):
+        answer.part2(61, count_steps(floors))
 
 
 def count_steps(floors: list[Floor]) -> int | None:
@@ -112,9 +111,11 @@ def count_steps(floors: list[Floor]) -> int | None:
     end = get_end_state(start)
     search = Search[State](
         start=start,
-        end=end,
         neighbors=get_adjacent,
+        done=lambda state: state == end,
     )
+    # moves are pruned enough that the first path found is also the shortest, and
+    # dfs finds it while exploring far fewer states than bfs
     return search.dfs()
 
 
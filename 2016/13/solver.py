@@ -33,28 +33,9 @@ class Maze:
 @answer.timer
 def main() -> None:
     maze = Maze(grid=dict(), favorite_number=Parser().integer())
-    start: Point = (1, 1)
-    search = Search[Point](
-        start=start,
-        end=(31, 39),
-        neighbors=maze.get_adjacent,
-    )
-    answer.part1(92, search.bfs())
-    answer.part2(124, len(reachable(start, 50, maze)))
-
-
-def reachable(start: Point, maximum: int, maze: Maze) -> set[Point]:
-    queue: list[tuple[int, Point]] = [(0, start)]
-    seen: set[Point] = set()
-    while len(queue) > 0:
-        length, position = queue.pop(0)
-        if position in seen:
-            continue
-        seen.add(position)
-        for adjacent in maze.get_adjacent(position):
-            if adjacent not in seen and length < maximum:
-                queue.append((length + 1, adjacent))
-    return seen
+    search = Search[Point](start=(1, 1), neighbors=maze.get_adjacent)
+    answer.part1(92, search.bidirectional((31, 39)))
+    answer.part2(124, len(search.distances(50)))
 
 
 if __name__ == "__main__":
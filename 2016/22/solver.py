@@ -65,8 +65,8 @@ def calculate_transfers(nodes: Grid[Node]) -> int:
     end = (max([point[0] for point in nodes]) - 1, 1)
     search = Search[Point](
         start=start,
-        end=end,
         neighbors=lambda point: get_adjacent(nodes, point),
+        done=lambda point: point == end,
     )
     to_free = search.bfs()
     assert to_free is not None
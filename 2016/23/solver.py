@@ -1,5 +1,3 @@
-import math
-
 from aoc import answer
 from aoc.assembunny import Computer
 from aoc.parser import Parser
@@ -9,8 +7,7 @@ from aoc.parser import Parser
 def main() -> None:
     lines = Parser().lines()
     answer.part1(11662, run(lines, 7))
-    # simplifies to n! + 77*86
-    answer.part2(479008222, math.factorial(12) + 77 * 86)
+    answer.part2(479008222, run(lines, 12))
 
 
 def run(lines: list[str], a: int) -> int:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from aoc import answer
 from aoc.parser import Parser
 from aoc.point import Point, PointHelper
-from aoc.search import Search
+from aoc.search import Dijkstra
 
 WALL, OPEN = "#", "."
 
@@ -20,22 +20,15 @@ class Grid:
     grid: dict[Point, str]
 
     def compute_distances(self) -> dict[tuple[str, str], int]:
-        distances: dict[tuple[str, str], int] = dict()
-        for start in self.get_markers():
-            for end in self.get_markers():
-                if start.name == end.name:
-                    continue
-                distance = distances.get((end.name, start.name))
-                if distance is None:
-                    search = Search[Point](
-                        start=start.point,
-                        end=end.point,
-                        neighbors=self.get_adjacent,
-                    )
-                    distance = search.bfs()
-                    assert distance is not None
-                distances[(start.name, end.name)] = distance
-        return distances
+        markers = {marker.point: marker.name for marker in self.get_markers()}
+        pairs = Dijkstra[Point].pairs(
+            list(markers),
+            lambda point: [(1, adjacent) for adjacent in self.get_adjacent(point)],
+        )
+        return {
+            (markers[start], markers[end]): distance
+            for (start, end), distance in pairs.items()
+        }
 
     def get_markers(self) -> list[Marker]:
         markers: list[Marker] = []
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import override
 
 from aoc import answer
+from aoc.cycle import detect
 from aoc.parser import Parser
 
 
@@ -31,22 +32,15 @@ class Dance:
 @answer.timer
 def main() -> None:
     moves: list[str] = Parser().csv()
-    pattern = get_pattern(moves)
-    answer.part1("eojfmbpkldghncia", pattern[1])
-    answer.part2("iecopnahgdflmkjb", pattern[1_000_000_000 % len(pattern)])
 
-
-def get_pattern(moves: list[str]) -> list[str]:
-    dance: Dance = Dance(
-        dancers=deque([chr(ord("a") + i) for i in range(16)]),
-    )
-    # Pattern happens to repeat from start immediately once we see
-    # a value that is the same
-    pattern: list[str] = []
-    while str(dance) not in pattern:
-        pattern.append(str(dance))
+    def step(order: str) -> str:
+        dance = Dance(dancers=deque(order))
         perform_dance(dance, moves)
-    return pattern
+        return str(dance)
+
+    cycle, states = detect("abcdefghijklmnop", step)
+    answer.part1("eojfmbpkldghncia", states[cycle.index(1)])
+    answer.part2("iecopnahgdflmkjb", states[cycle.index(1_000_000_000)])
 
 
 def perform_dance(dance: Dance, moves: list[str]) -> None:
@@ -1,4 +1,3 @@
-import re
 from dataclasses import dataclass
 
 from aoc import answer
@@ -23,8 +22,7 @@ class Claim:
 
 @answer.timer
 def main() -> None:
-    lines = Parser().lines()
-    grid = get_overlap_grid(lines)
+    grid = get_overlap_grid(Parser().int_tuples(5))
 
     all_claims: set[int] = set()
     multiple_claims: set[int] = set()
@@ -39,9 +37,9 @@ def main() -> None:
     answer.part2(1276, next(iter(all_claims.difference(multiple_claims))))
 
 
-def get_overlap_grid(lines: list[str]) -> dict[Point, list[int]]:
+def get_overlap_grid(rows: list[tuple[int, ...]]) -> dict[Point, list[int]]:
     grid: dict[Point, list[int]] = dict()
-    for claim in get_claims(lines):
+    for claim in get_claims(rows):
         for point in claim.get_points():
             if point not in grid:
                 grid[point] = []
@@ -49,18 +47,11 @@ def get_overlap_grid(lines: list[str]) -> dict[Point, list[int]]:
     return grid
 
 
-def get_claims(lines: list[str]) -> list[Claim]:
-    claim_pattern = "^#(.*) @ (.*),(.*): (.*)x(.*)$"
+def get_claims(rows: list[tuple[int, ...]]) -> list[Claim]:
+    # #1 @ 1,3: 4x4
     claims: list[Claim] = []
-    for line in lines:
-        match = re.match(claim_pattern, line)
-        assert match is not None
-        claim = Claim(
-            claim_id=int(match[1]),
-            point=(int(match[2]), int(match[3])),
-            width=int(match[4]),
-            height=int(match[5]),
-        )
+    for claim_id, x, y, width, height in rows:
+        claim = Claim(claim_id=claim_id, point=(x, y), width=width, height=height)
         claims.append(claim)
     return claims
 
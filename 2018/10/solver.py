@@ -1,4 +1,3 @@
-import re
 from dataclasses import dataclass
 
 from aoc import answer
@@ -36,8 +35,7 @@ class Particles:
 
 @answer.timer
 def main() -> None:
-    lines = Parser().lines()
-    particles = get_particles(lines)
+    particles = get_particles(Parser().int_tuples(4))
     time = min_area(particles)
     expected = [
         ".####...#####......###..#.......#.......#.......#.......#....#",
@@ -55,18 +53,11 @@ def main() -> None:
     answer.part2(10515, time)
 
 
-def get_particles(lines: list[str]) -> Particles:
+def get_particles(rows: list[tuple[int, ...]]) -> Particles:
+    # position=< 9,  1> velocity=< 0,  2>
     particles: list[Particle] = []
-    pattern = "^position=<(.*), (.*)> velocity=<(.*), (.*)>$"
-    for line in lines:
-        match = re.match(pattern, line)
-        if match is None:
-            raise Exception(f"Cannot parse: {line}")
-        particle = Particle(
-            position=(int(match[1]), int(match[2])),
-            velocity=(int(match[3]), int(match[4])),
-        )
-        particles.append(particle)
+    for x, y, dx, dy in rows:
+        particles.append(Particle(position=(x, y), velocity=(dx, dy)))
     return Particles(particles=particles)
 
 
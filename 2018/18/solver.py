@@ -1,78 +1,34 @@
-from dataclasses import dataclass
-
 from aoc import answer
-from aoc.grid import Grid
+from aoc.automaton import Automaton
+from aoc.cycle import detect
 from aoc.parser import Parser
-from aoc.point import Point, PointHelper
-
-OPEN, TREES, YARD = ".", "|", "#"
-
-
-@dataclass(frozen=True)
-class Landscape:
-    grid: Grid[str]
-
-    def step(self) -> None:
-        new_grid: Grid[str] = dict()
-        for point, value in self.grid.items():
-            if value == OPEN:
-                if self.count(point, TREES) >= 3:
-                    new_grid[point] = TREES
-            elif value == TREES:
-                if self.count(point, YARD) >= 3:
-                    new_grid[point] = YARD
-            elif value == YARD:
-                if self.count(point, YARD) == 0 or self.count(point, TREES) == 0:
-                    new_grid[point] = OPEN
-            else:
-                raise Exception(f"Unknown value {value}")
-        for point in new_grid:
-            self.grid[point] = new_grid[point]
 
-    def count(self, point: Point, value: str) -> int:
-        neighbors = PointHelper.all_neighbors(point)
-        return sum([self.grid.get(neighbor) == value for neighbor in neighbors])
+OPEN, TREES, YARD = ord("."), ord("|"), ord("#")
 
-    def resource_value(self) -> int:
-        return self.resource_count(TREES) * self.resource_count(YARD)
 
-    def resource_count(self, goal: str) -> int:
-        return sum([resource == goal for _, resource in self.grid.items()])
+def rule(value: int, neighbors: list[int]) -> int:
+    if value == OPEN:
+        return TREES if neighbors.count(TREES) >= 3 else OPEN
+    elif value == TREES:
+        return YARD if neighbors.count(YARD) >= 3 else TREES
+    elif value == YARD:
+        if neighbors.count(YARD) == 0 or neighbors.count(TREES) == 0:
+            return OPEN
+        return YARD
+    else:
+        raise Exception(f"Unknown value {chr(value)}")
 
 
 @answer.timer
 def main() -> None:
-    rows = Parser().nested_lines()
-    answer.part1(515496, run_for(rows, 10))
-    answer.part2(233058, run_for(rows, 1_000_000_000))
-
-
-def run_for(rows: list[list[str]], n: int) -> int:
-    landscape = Landscape(get_grid(rows))
-    scores = [landscape.resource_value()]
-    for _ in range(n):
-        landscape.step()
-        scores.append(landscape.resource_value())
-        start, pattern = find_pattern(scores)
-        if start is not None:
-            index = (n - start) % len(pattern)
-            return pattern[index]
-    return scores[-1]
-
-
-def find_pattern(values: list[int]) -> tuple[int | None, list[int]]:
-    for i in range(1, len(values) - 1):
-        if values[i] == values[-1] and values[i - 1] == values[-2]:
-            return i - 1, values[i - 1 : -2]
-    return None, []
+    grid = Parser().dense_grid()
+    cycle, states = detect(grid.cells, Automaton(grid, rule).next, key=bytes)
+    answer.part1(515496, resource_value(states[cycle.index(10)]))
+    answer.part2(233058, resource_value(states[cycle.index(1_000_000_000)]))
 
 
-def get_grid(rows: list[list[str]]) -> Grid[str]:
-    grid: Grid[str] = dict()
-    for y, row in enumerate(rows):
-        for x, value in enumerate(row):
-            grid[(x, y)] = value
-    return grid
+def resource_value(cells: bytearray) -> int:
+    return cells.count(TREES) * cells.count(YARD)
 
 
 if __name__ == "__main__":
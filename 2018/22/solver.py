@@ -1,4 +1,3 @@
-import heapq
 from dataclasses import dataclass
 from typing import Self
 
@@ -6,6 +5,7 @@ from aoc import answer
 from aoc.grid import Grid
 from aoc.parser import Parser
 from aoc.point import Point, PointHelper
+from aoc.search import Dijkstra
 
 GEAR, TORCH, NEITHER = "g", "t", "n"
 VALID_TOOL: dict[int, set[str]] = {
@@ -52,9 +52,12 @@ def main() -> None:
     parts = lines[1].split()[-1].split(",")
     target = (int(parts[0]), int(parts[1]))
     cave = build_out_cave(int(lines[0].split()[-1]), target)
+    answer.parsed()
 
-    answer.part1(11575, risk_within(cave, target))
-    answer.part2(1068, traverse(cave, ((0, 0), TORCH), target))
+    with answer.phase(1):
+        answer.part1(11575, risk_within(cave, target))
+    with answer.phase(2):
+        answer.part2(1068, traverse(cave, ((0, 0), TORCH), target))
 
 
 def build_out_cave(depth: int, target: Point) -> Grid[Region]:
@@ -78,33 +81,33 @@ def risk_within(cave: Grid[Region], target: Point) -> int:
 
 
 def traverse(cave: Grid[Region], start: State, end: Point) -> int | None:
-    queue: list[tuple[int, State]] = []
-    seen: set[State] = set()
-
-    def add_item(time: int, state: State) -> None:
-        if state not in seen:
-            heapq.heappush(queue, (time, state))
-
-    add_item(0, start)
-    while len(queue) > 0:
-        time, (location, item) = heapq.heappop(queue)
-        if (location, item) in seen:
-            continue
-        seen.add((location, item))
-        if location == end and item == TORCH:
-            return time
-        elif location == end:
-            add_item(time + 7, (location, TORCH))
-        else:
-            for neighbor in PointHelper.neighbors(location):
-                if neighbor not in cave:
-                    continue
-                if item in cave[neighbor].tools:
-                    add_item(time + 1, (neighbor, item))
-                else:
-                    for next_item in cave[neighbor].tools & cave[location].tools:
-                        add_item(time + 8, (neighbor, next_item))
-    return None
+    def neighbors(state: State) -> list[tuple[int, State]]:
+        location, item = state
+        if location == end:
+            return [(7, (location, TORCH))]
+        result: list[tuple[int, State]] = []
+        for neighbor in PointHelper.neighbors(location):
+            if neighbor not in cave:
+                continue
+            if item in cave[neighbor].tools:
+                result.append((1, (neighbor, item)))
+            else:
+                for next_item in cave[neighbor].tools & cave[location].tools:
+                    result.append((8, (neighbor, next_item)))
+        return result
+
+    def heuristic(state: State) -> int:
+        # every step costs at least 1 and finishing requires the torch
+        location, item = state
+        return PointHelper.manhattan(location, end) + (0 if item == TORCH else 7)
+
+    search = Dijkstra[State](
+        start=start,
+        done=lambda state: state == (end, TORCH),
+        neighbors=neighbors,
+        heuristic=heuristic,
+    )
+    return search.run()
 
 
 if __name__ == "__main__":
@@ -15,17 +15,10 @@ class NanoBot:
     r: int
 
     @classmethod
-    def new(cls, s: str) -> Self:
+    def new(cls, values: tuple[int, ...]) -> Self:
         # pos=<1,-2,3>, r=4
-        pos, r = s.split(", ")
-        x, y, z = pos.split("=")[1][1:-1].split(",")
-        _, r = r.split("=")
-        return cls(
-            x=int(x),
-            y=int(y),
-            z=int(z),
-            r=int(r),
-        )
+        x, y, z, r = values
+        return cls(x=x, y=y, z=z, r=r)
 
     def __contains__(self, o: Self) -> bool:
         dx, dy, dz = self.x - o.x, self.y - o.y, self.z - o.z
@@ -37,7 +30,7 @@ class NanoBot:
 
 @answer.timer
 def main() -> None:
-    bots = [NanoBot.new(line) for line in Parser().lines()]
+    bots = [NanoBot.new(values) for values in Parser().int_tuples(4)]
     bots.sort(key=lambda bot: bot.r)
     strongest = bots[-1]
     answer.part1(383, sum([bot in strongest for bot in bots]))
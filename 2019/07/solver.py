@@ -1,15 +1,30 @@
+from dataclasses import dataclass
 from itertools import permutations
-from typing import Self
+from typing import Any, Self
 
 from aoc import answer
 from aoc.intcode import Computer
 from aoc.parser import Parser
 
 
+@dataclass
+class Phase:
+    setting: int
+
+    def active(self) -> bool:
+        return True
+
+    def get_input(self) -> int:
+        return self.setting
+
+    def add_output(self, value: int) -> None:
+        raise Exception(f"unexpected output before signal: {value}")
+
+
 class Amplifier:
-    def __init__(self, memory: list[int], setting: int, pause: bool):
-        self.computer: Computer[Self] = Computer(bus=self, memory=memory)
-        self.inputs: list[int] = [setting]
+    def __init__(self, start: Computer[Any], pause: bool):
+        self.computer: Computer[Self] = start.fork(self)
+        self.inputs: list[int] = []
         self.outputs: list[int] = []
         self.load: bool = False
         self.pause: bool = pause
@@ -38,16 +53,25 @@ def main() -> None:
 
 
 def run(memory: list[int], sequence: list[int], pause: bool) -> int:
+    # handle each phase setting once, then fork amplifiers from there
+    starts: dict[int, Computer[Phase]] = dict()
+    for setting in sequence:
+        start = Computer(bus=Phase(setting), memory=memory.copy())
+        assert start.until_input() and start.step() and start.until_input()
+        starts[setting] = start
+
     result: int = 0
     for possibility in permutations(sequence):
-        value = check(memory, possibility, pause)
+        value = check(starts, possibility, pause)
         result = max(result, value)
     return result
 
 
-def check(memory: list[int], sequence: tuple[int, ...], pause: bool) -> int:
+def check(
+    starts: dict[int, Computer[Phase]], sequence: tuple[int, ...], pause: bool
+) -> int:
     amplifiers: list[Amplifier] = [
-        Amplifier(memory.copy(), entry, pause) for entry in sequence
+        Amplifier(starts[entry], pause) for entry in sequence
     ]
     output, state = 0, True
     while state:
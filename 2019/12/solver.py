@@ -38,8 +38,8 @@ class System:
     bodies: list[Body]
 
     @classmethod
-    def new(cls, lines: list[str]) -> Self:
-        return cls(bodies=[Body.new(line) for line in lines])
+    def new(cls, rows: list[tuple[int, ...]]) -> Self:
+        return cls(bodies=[Body.new(values) for values in rows])
 
     def step(self) -> None:
         for body in self.bodies:
@@ -61,8 +61,9 @@ class Body:
     velocity: Vector
 
     @classmethod
-    def new(cls, s: str) -> Self:
-        x, y, z = [int(part.split("=")[1]) for part in s[1:-1].split(", ")]
+    def new(cls, values: tuple[int, ...]) -> Self:
+        # <x=-1, y=0, z=2>
+        x, y, z = values
         return cls((x, y, z), (0, 0, 0))
 
     def add_gravity(self, other: Self) -> None:
@@ -81,23 +82,23 @@ class Body:
 
 @answer.timer
 def main() -> None:
-    lines = Parser().lines()
-    answer.part1(5350, run(lines, 1_000))
-    answer.part2(467034091553512, system_period(lines))
+    rows = Parser().int_tuples(3)
+    answer.part1(5350, run(rows, 1_000))
+    answer.part2(467034091553512, system_period(rows))
 
 
-def run(lines: list[str], n: int) -> int:
-    system = System.new(lines)
+def run(rows: list[tuple[int, ...]], n: int) -> int:
+    system = System.new(rows)
     for _ in range(n):
         system.step()
     return system.energy()
 
 
-def system_period(lines: list[str]) -> int:
+def system_period(rows: list[tuple[int, ...]]) -> int:
     def lcm(a: int, b: int) -> int:
         return abs(a * b) // math.gcd(a, b)
 
-    system = System.new(lines)
+    system = System.new(rows)
     period = component_periods(system)
     return lcm(lcm(period[0], period[1]), period[2])
 
@@ -5,6 +5,7 @@ from aoc.grid import Grid
 from aoc.intcode import Computer
 from aoc.parser import Parser
 from aoc.point import Point, PointHelper
+from aoc.search import Search
 
 WALL, EMPTY, OXYGEN = 0, 1, 2
 DIRECTIONS: dict[int, Point] = {1: (0, 1), 2: (0, -1), 3: (-1, 0), 4: (1, 0)}
@@ -60,26 +61,30 @@ class RepairDroid:
 class Traverser:
     grid: Grid[int]
 
+    def search(self, start: Point) -> Search[Point]:
+        return Search[Point](
+            start=start,
+            neighbors=self.neighbors,
+            done=lambda point: self.grid[point] == OXYGEN,
+        )
+
+    def neighbors(self, position: Point) -> list[Point]:
+        return [
+            next_position
+            for next_position in PointHelper.neighbors(position)
+            if self.grid.get(next_position, WALL) != WALL
+        ]
+
     def bfs(self, start: Point) -> int:
-        queue: list[tuple[int, Point]] = [(0, start)]
-        seen: set[Point] = set()
-        while len(queue) > 0:
-            minutes, position = queue.pop(0)
-            if position in seen:
-                continue
-            seen.add(position)
-            if self.grid[position] == OXYGEN:
-                return minutes
-            for next_position in PointHelper.neighbors(position):
-                if self.grid.get(next_position, WALL) != WALL:
-                    if next_position not in seen:
-                        queue.append((minutes + 1, next_position))
-        raise Exception("No path found")
+        result = self.search(start).bfs()
+        if result is None:
+            raise Exception("No path found")
+        return result
 
     def time_for_air(self) -> int:
-        empty = [location for location, value in self.grid.items() if value == EMPTY]
-        steps_needed = [self.bfs(position) for position in empty]
-        return max(steps_needed)
+        # furthest open position from oxygen is the last one to be filled
+        oxygen = [location for location, value in self.grid.items() if value == OXYGEN]
+        return max(self.search(oxygen[0]).distances().values())
 
 
 @answer.timer
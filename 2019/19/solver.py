@@ -26,16 +26,20 @@ class Beam:
 
 @dataclass(frozen=True)
 class Tester:
-    memory: list[int]
+    computer: Computer[Beam]
     beam_starts: dict[int, int]
 
     def test(self, point: Point) -> int:
         beam = Beam(point)
-        Computer(bus=beam, memory=self.memory.copy()).run()
+        self.computer.fork(beam).run()
         result = beam.value
         assert result is not None
         return result
 
+    def test_all(self, points: list[Point]) -> list[int]:
+        inputs = [[x, y] for x, y in points]
+        return [outputs[0] for outputs in self.computer.batch(inputs)]
+
     def left_most(self, y: int) -> int:
         x = self.beam_starts.get(y - 1, 0)
         while self.test((x, y)) != 1:
@@ -51,17 +55,17 @@ class Tester:
 @answer.timer
 def main() -> None:
     memory = Parser().int_csv()
-    tester = Tester(memory=memory, beam_starts=dict())
+    # every probe runs the same instructions until the first input
+    computer = Computer(bus=Beam((0, 0)), memory=memory)
+    assert computer.until_input()
+    tester = Tester(computer=computer, beam_starts=dict())
     answer.part1(160, affected_points(tester, 50))
     answer.part2(9441282, bounding_point(tester, 100))
 
 
 def affected_points(tester: Tester, size: int) -> int:
-    result = 0
-    for y in range(size):
-        for x in range(size):
-            result += tester.test((x, y))
-    return result
+    points = [(x, y) for y in range(size) for x in range(size)]
+    return sum(tester.test_all(points))
 
 
 def bounding_point(tester: Tester, size: int) -> int:
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Self
 
 from aoc import answer
+from aoc.cycle import detect
 from aoc.parser import Parser
 from aoc.point import Point
 
@@ -72,17 +73,18 @@ def main() -> None:
     for point, value in Parser().grid().items():
         if value == "#":
             grid.add((point, 0))
-    answer.part1(32776479, part_1(grid))
-    answer.part2(2017, part_2(grid))
+    answer.parsed()
+    with answer.phase(1):
+        answer.part1(32776479, part_1(grid))
+    with answer.phase(2):
+        answer.part2(2017, part_2(grid))
 
 
 def part_1(start_grid: set[Location]) -> int:
-    seen: list[Layout] = []
+    # diversity is unique to each layout without recursion so serves as its key
     layout = Layout(start_grid, False)
-    while layout not in seen:
-        seen.append(layout)
-        layout = layout.step()
-    return layout.diversity()
+    cycle, states = detect(layout, Layout.step, key=Layout.diversity)
+    return states[cycle.start].diversity()
 
 
 def part_2(start_grid: set[Location]) -> int:
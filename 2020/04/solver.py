@@ -84,9 +84,13 @@ class Passport:
 
 @answer.timer
 def main() -> None:
-    passports = [Passport.new(group) for group in Parser().line_groups()]
-    answer.part1(200, sum([passport.validate(False) for passport in passports]))
-    answer.part2(116, sum([passport.validate(True) for passport in passports]))
+    present, valid = 0, 0
+    for group in Parser().iter_groups():
+        passport = Passport.new(group)
+        present += passport.validate(False)
+        valid += passport.validate(True)
+    answer.part1(200, present)
+    answer.part2(116, valid)
 
 
 if __name__ == "__main__":
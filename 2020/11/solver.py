@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import Self
 
 from aoc import answer
-from aoc.grid import Grid
+from aoc.grid import DenseGrid
 from aoc.parser import Parser
 from aoc.point import Point, PointHelper
 
@@ -27,71 +27,53 @@ class Seat(StrEnum):
 
 @dataclass(frozen=True)
 class SeatingChart:
-    chart: Grid[Seat]
-    look: bool
-
-    def next(self) -> Self:
-        next_chart: Grid[Seat] = dict()
-        for p, seat in self.chart.items():
-            next_chart[p] = self.next_seat(p, seat)
-        return type(self)(chart=next_chart, look=self.look)
-
-    def next_seat(self, p: Point, seat: Seat) -> Seat:
-        match seat:
-            case Seat.FLOOR:
-                return seat
-            case Seat.EMPTY:
-                if self.adjacent_occupied(p) == 0:
-                    return Seat.OCCUPIED
-                else:
-                    return seat
-            case Seat.OCCUPIED:
-                to_empty = 5 if self.look else 4
-                if self.adjacent_occupied(p) >= to_empty:
-                    return Seat.EMPTY
-                else:
-                    return seat
-
-    def adjacent_occupied(self, p: Point) -> int:
-        result = 0
+    chart: DenseGrid
+    # index of every seat along with the indices of the seats it considers
+    seats: list[tuple[int, list[int]]]
+
+    @classmethod
+    def new(cls, chart: DenseGrid, look: bool) -> Self:
+        seats: list[tuple[int, list[int]]] = []
+        for index, value in enumerate(chart.cells):
+            if value != ord(Seat.FLOOR):
+                seats.append((index, SeatingChart.visible(chart, index, look)))
+        return cls(chart, seats)
+
+    @staticmethod
+    def visible(chart: DenseGrid, index: int, look: bool) -> list[int]:
+        result: list[int] = []
         for direction in DIRECTIONS:
-            seat = self.explore_direction(p, direction)
-            if seat == Seat.OCCUPIED:
-                result += 1
+            point = PointHelper.add(chart.point(index), direction)
+            while look and chart.get(point) == Seat.FLOOR:
+                point = PointHelper.add(point, direction)
+            if point in chart:
+                result.append(chart.index(point))
         return result
 
-    def explore_direction(self, p: Point, direction: Point) -> Seat | None:
-        point = PointHelper.add(p, direction)
-        seat = self.chart.get(point)
-        if not self.look:
-            return seat
-        while seat == Seat.FLOOR:
-            point = PointHelper.add(point, direction)
-            seat = self.chart.get(point)
-        return seat
-
-    def occupied(self) -> int:
-        return sum([seat == Seat.OCCUPIED for seat in self.chart.values()])
+    def run(self, to_empty: int) -> int:
+        empty, occupied = ord(Seat.EMPTY), ord(Seat.OCCUPIED)
+        cells, changed = self.chart.cells, True
+        while changed:
+            changed, next_cells = False, cells.copy()
+            for index, neighbors in self.seats:
+                count = sum([cells[neighbor] == occupied for neighbor in neighbors])
+                if cells[index] == empty and count == 0:
+                    next_cells[index] = occupied
+                    changed = True
+                elif cells[index] == occupied and count >= to_empty:
+                    next_cells[index] = empty
+                    changed = True
+            cells = next_cells
+        return cells.count(occupied)
 
 
 @answer.timer
 def main() -> None:
-    chart: Grid[Seat] = dict()
-    for y, row in enumerate(Parser().nested_lines()):
-        for x, value in enumerate(row):
-            chart[(x, y)] = Seat(value)
-
-    answer.part1(2386, run(chart, False))
-    answer.part2(2091, run(chart, True))
-
-
-def run(chart: Grid[Seat], look: bool) -> int:
-    previous, current = None, SeatingChart(chart, look)
-    while previous != current:
-        previous = current
-        current = current.next()
-    assert previous is not None
-    return previous.occupied()
+    chart = Parser().dense_grid()
+    with answer.phase(1):
+        answer.part1(2386, SeatingChart.new(chart, False).run(4))
+    with answer.phase(2):
+        answer.part2(2091, SeatingChart.new(chart, True).run(5))
 
 
 if __name__ == "__main__":
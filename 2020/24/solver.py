@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from aoc import answer
+from aoc.automaton import Cell, SparseAutomaton
 from aoc.parser import Parser
 from aoc.point import Point, PointHelper
 
@@ -14,13 +15,13 @@ DIRECTIONS: dict[str, Point] = dict(
 )
 
 
-def neighbors(p: Point) -> list[Point]:
-    return [PointHelper.add(p, direction) for direction in DIRECTIONS.values()]
+def rule(black: bool, count: int) -> bool:
+    return count == 2 or (black and count == 1)
 
 
 @dataclass(frozen=True)
 class Floor:
-    floor: dict[Point, bool]
+    black: set[Point]
 
     def follow_path(self, path: str) -> None:
         point: Point = (0, 0)
@@ -28,39 +29,23 @@ class Floor:
         for letter in path_iter:
             instruction = letter if letter in ["e", "w"] else letter + next(path_iter)
             point = PointHelper.add(point, DIRECTIONS[instruction])
-        self.floor[point] = not self.get(point)
-
-    def transform(self) -> None:
-        # Track number of black tiles adjacent to every point on the floor
-        counts: dict[Point, int] = dict()
-        for point, tile in self.floor.items():
-            counts[point] = counts.get(point, 0)
-            if not tile:
-                for neighbor in neighbors(point):
-                    counts[neighbor] = counts.get(neighbor, 0) + 1
-        # Flip tiles depending on current state and number of adjacent black tiles
-        for point, count in counts.items():
-            tile = self.get(point)
-            flip_counts = [2] if tile else [0, 3, 4, 5, 6]
-            if count in flip_counts:
-                self.floor[point] = not tile
-
-    def get(self, point: Point) -> bool:
-        return self.floor.get(point, True)
-
-    def count_black(self):
-        return sum([not tile for tile in self.floor.values()])
+        if point in self.black:
+            self.black.remove(point)
+        else:
+            self.black.add(point)
 
 
 @answer.timer
 def main() -> None:
-    floor = Floor(dict())
+    floor = Floor(set())
     for path in Parser().lines():
         floor.follow_path(path)
-    answer.part1(320, floor.count_black())
-    for _ in range(100):
-        floor.transform()
-    answer.part2(3777, floor.count_black())
+    answer.part1(320, len(floor.black))
+    black: set[Cell] = set(floor.black)
+    directions: list[Cell] = list(DIRECTIONS.values())
+    tiles = SparseAutomaton(black, directions, rule)
+    tiles.run(100)
+    answer.part2(3777, len(tiles.active))
 
 
 if __name__ == "__main__":
@@ -6,24 +6,21 @@ from aoc.parser import Parser
 
 @answer.timer
 def main() -> None:
-    data = Parser().string()
-    answer.part1(159892596, parse(data, False))
-    answer.part2(92626942, parse(data, True))
-
-
-def parse(data: str, toggle: bool) -> int:
-    result: int = 0
-    enabled: bool = True
-    commands = re.findall(r"mul\(\d+,\d+\)|do\(\)|don't\(\)", data)
-    for command in commands:
-        if command.startswith("mul") and enabled:
-            v1, v2 = command[4:-1].split(",")
-            result += int(v1) * int(v2)
-        elif command == "do()" and toggle:
-            enabled = True
-        elif command == "don't()" and toggle:
-            enabled = False
-    return result
+    # instructions never span lines so the enabled state is all that carries over
+    result, enabled_result, enabled = 0, 0, True
+    for line in Parser().iter_lines():
+        for command in re.findall(r"mul\(\d+,\d+\)|do\(\)|don't\(\)", line):
+            if command == "do()":
+                enabled = True
+            elif command == "don't()":
+                enabled = False
+            else:
+                v1, v2 = command[4:-1].split(",")
+                value = int(v1) * int(v2)
+                result += value
+                enabled_result += value if enabled else 0
+    answer.part1(159892596, result)
+    answer.part2(92626942, enabled_result)
 
 
 if __name__ == "__main__":
@@ -25,10 +25,11 @@ class Machine:
         return cls(diagram, joltage, buttons)
 
     def start(self) -> int:
+        end = tuple(self.diagram)
         search = Search[tuple[bool, ...]](
             start=tuple([False] * len(self.diagram)),
-            end=tuple(self.diagram),
             neighbors=self.neighbors,
+            done=lambda state: state == end,
         )
         result = search.bfs()
         assert result is not None
@@ -1,15 +1,86 @@
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from functools import wraps
 from typing import Callable
 
 
+@dataclass
+class Clock:
+    """
+    Monotonic timestamps of a single run. Parsing ends at the last parsed() before
+    solving starts. Parts are only timed when solved inside a phase, since solvers
+    often compute both parts before giving either answer.
+    """
+
+    start: int
+    parsed: int
+    solving: bool = False
+    parts: dict[int, int] = field(default_factory=dict)
+
+    def phases(self) -> dict[str, int]:
+        result: dict[str, int] = dict(parse=self.parsed - self.start)
+        for part, ns in sorted(self.parts.items()):
+            result[f"part{part}"] = ns
+        return result
+
+
+clock: Clock | None = None
+
+
 def timer(solution: Callable[[], None]) -> Callable[[], None]:
     @wraps(solution)
     def wrapper() -> None:
-        start = time.time_ns()
-        solution()
-        end = time.time_ns()
-        print(f"Runtime (ns): {end - start}")
+        global clock
+        start = time.perf_counter_ns()
+        clock = Clock(start, start)
+        try:
+            solution()
+            end = time.perf_counter_ns()
+            print(f"Runtime (ns): {end - start}")
+            phases = [f"{name}={ns}" for name, ns in clock.phases().items()]
+            print(f"Phases (ns): {' '.join(phases)}")
+        finally:
+            clock = None
+
+    return wrapper
+
+
+def parsed() -> None:
+    """
+    Marks the end of parsing, called by Parser after reading the input. Solvers that
+    do more work to build their structures can call it again once they are done,
+    marks after the first phase or answer are ignored.
+    """
+    if clock is not None and not clock.solving:
+        clock.parsed = time.perf_counter_ns()
+
+
+@contextmanager
+def phase(part: int) -> Iterator[None]:
+    """
+    Times solving a single part, i.e. with answer.phase(2): answer.part2(...), any
+    parsing done within it is counted as part of solving.
+    """
+    current = clock
+    if current is not None:
+        current.solving = True
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        if current is not None:
+            elapsed = time.perf_counter_ns() - start
+            current.parts[part] = current.parts.get(part, 0) + elapsed
+
+
+def parsing[**P, R](method: Callable[P, R]) -> Callable[P, R]:
+    @wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        result = method(*args, **kwargs)
+        parsed()
+        return result
 
     return wrapper
 
@@ -23,6 +94,8 @@ def part2[T](expected: T, actual: T) -> None:
 
 
 def part[T](part: int, expected: T, actual: T) -> None:
+    if clock is not None:
+        clock.solving = True
     if expected != actual:
         raise Exception(f"Part {part}: expected {expected} got {actual}")
     print(f"Part {part}: {actual}")
@@ -2,6 +2,16 @@ from dataclasses import dataclass
 from enum import StrEnum, auto
 from typing import Self
 
+REGISTERS = "abcd"
+
+# decoded form of an instruction: (opcode, x is register, x, y is register, y)
+# where register operands hold an index into the register array and others hold
+# an immediate value, resolved once rather than on every step
+type Code = tuple[int, bool, int, bool, int]
+
+# opcode used for the start of a loop that is executed as a single step
+LOOP = -1
+
 
 @dataclass(frozen=True)
 class Computer:
@@ -10,44 +20,69 @@ class Computer:
 
     @classmethod
     def new(cls, overrides: dict[str, int]) -> Self:
-        result = cls(dict(a=0, b=0, c=0, d=0), [])
+        result = cls({name: 0 for name in REGISTERS}, [])
         for key, value in overrides.items():
             result.set(key, value)
         return result
 
     def run(self, lines: list[str]) -> bool:
-        ip = 0
         instructions = [Instruction.new(line) for line in lines]
-        while ip >= 0 and ip < len(instructions) and len(self.outputs) < 100:
+        plain = [instruction.decode() for instruction in instructions]
+        loops = [Loop.new(instructions, i) for i in range(len(instructions))]
+        code = [Computer.code(plain, loops, i) for i in range(len(instructions))]
+        registers = [self.registers[name] for name in REGISTERS]
+        outputs = self.outputs
+
+        cpy, inc, dec, jnz, tgl, out = [op.code() for op in Operation]
+        ip, n, success = 0, len(code), True
+        while ip >= 0 and ip < n and len(outputs) < 100:
+            op, xr, x, yr, y = code[ip]
+            if op == LOOP:
+                loop = loops[ip]
+                assert loop is not None
+                if loop.apply(registers):
+                    ip += loop.length
+                    continue
+                # loop would not terminate normally, execute it step by step
+                op, xr, x, yr, y = plain[ip]
             move = 1
-            instruction = instructions[ip]
-            match instruction.operation:
-                case Operation.CPY:
-                    x, y = instruction.args
-                    self.set(y, self.get(x))
-                case Operation.INC:
-                    (x,) = instruction.args
-                    self.set(x, self.get(x) + 1)
-                case Operation.DEC:
-                    (x,) = instruction.args
-                    self.set(x, self.get(x) - 1)
-                case Operation.JNZ:
-                    x, y = instruction.args
-                    if self.get(x) != 0:
-                        move = self.get(y)
-                case Operation.TGL:
-                    (x,) = instruction.args
-                    i = ip + self.get(x)
-                    if i < len(instructions):
-                        instructions[i] = instructions[i].toggle()
-                case Operation.OUT:
-                    (x,) = instruction.args
-                    value = self.get(x)
-                    if value != len(self.outputs) % 2:
-                        return False
-                    self.outputs.append(value)
+            if op == cpy:
+                # toggling can produce invalid copies into immediates, skip them
+                if yr:
+                    registers[y] = registers[x] if xr else x
+            elif op == inc:
+                if xr:
+                    registers[x] += 1
+            elif op == dec:
+                if xr:
+                    registers[x] -= 1
+            elif op == jnz:
+                if (registers[x] if xr else x) != 0:
+                    move = registers[y] if yr else y
+            elif op == tgl:
+                i = ip + (registers[x] if xr else x)
+                if i >= 0 and i < n:
+                    # only the toggled instruction and any loops containing it
+                    # need to be decoded again
+                    instructions[i] = instructions[i].toggle()
+                    plain[i] = instructions[i].decode()
+                    for j in range(max(i - Loop.MAX + 1, 0), i + 1):
+                        loops[j] = Loop.new(instructions, j)
+                        code[j] = Computer.code(plain, loops, j)
+            elif op == out:
+                value = registers[x] if xr else x
+                if value != len(outputs) % 2:
+                    success = False
+                    break
+                outputs.append(value)
             ip += move
-        return True
+
+        self.registers.update(zip(REGISTERS, registers))
+        return success
+
+    @staticmethod
+    def code(plain: list[Code], loops: list[Loop | None], i: int) -> Code:
+        return plain[i] if loops[i] is None else (LOOP, False, 0, False, 0)
 
     def get(self, value: str) -> int:
         result = self.registers.get(value)
@@ -71,6 +106,107 @@ class Instruction:
     def toggle(self) -> Self:
         return type(self)(self.operation.toggle(), self.args)
 
+    def decode(self) -> Code:
+        operands = self.operands()
+        operands += [(False, 0)] * (2 - len(operands))
+        (xr, x), (yr, y) = operands
+        return (self.operation.code(), xr, x, yr, y)
+
+    def operands(self) -> list[tuple[bool, int]]:
+        result: list[tuple[bool, int]] = []
+        for arg in self.args:
+            if arg in REGISTERS:
+                result.append((True, REGISTERS.index(arg)))
+            else:
+                result.append((False, int(arg)))
+        return result
+
+
+@dataclass(frozen=True)
+class Loop:
+    """
+    Recognized inc / dec / jnz idioms, executed as a single arithmetic step:
+
+    - add: inc a, dec b, jnz b -2 -> a += b
+    - multiply: cpy b c, inc a, dec c, jnz c -2, dec d, jnz d -5 -> a += b * d
+
+    Counters are left at 0 as they would be after running the loop normally.
+    """
+
+    MAX = 6
+
+    target: int
+    source: tuple[bool, int]
+    factor: int | None
+    counters: list[int]
+    length: int
+
+    @classmethod
+    def new(cls, instructions: list[Instruction], i: int) -> Self | None:
+        window = instructions[i : i + Loop.MAX]
+        add = Loop.add(window[:3])
+        if add is not None:
+            target, counter = add
+            return cls(target, (True, counter), None, [counter], 3)
+        if len(window) < 6 or window[0].operation != Operation.CPY:
+            return None
+        add = Loop.add(window[1:4])
+        outer = Loop.register(window[4], Operation.DEC)
+        if add is None or outer is None or not Loop.jump(window[5], outer, -5):
+            return None
+        target, inner = add
+        source = window[0].operands()[0]
+        # inner counter must be reset from a value neither loop modifies
+        if Loop.register(window[0], Operation.CPY, 1) != inner:
+            return None
+        if outer in [target, inner]:
+            return None
+        if source[0] and source[1] in [target, inner, outer]:
+            return None
+        return cls(target, source, outer, [inner, outer], 6)
+
+    @staticmethod
+    def add(window: list[Instruction]) -> tuple[int, int] | None:
+        # either order of inc target / dec counter followed by jnz counter -2
+        if len(window) < 3:
+            return None
+        first, second, jump = window
+        for inc, dec in [(first, second), (second, first)]:
+            target = Loop.register(inc, Operation.INC)
+            counter = Loop.register(dec, Operation.DEC)
+            if target is None or counter is None or target == counter:
+                continue
+            if Loop.jump(jump, counter, -2):
+                return target, counter
+        return None
+
+    @staticmethod
+    def jump(instruction: Instruction, counter: int, offset: int) -> bool:
+        register = Loop.register(instruction, Operation.JNZ)
+        return register == counter and instruction.args[1] == str(offset)
+
+    @staticmethod
+    def register(
+        instruction: Instruction, operation: Operation, arg: int = 0
+    ) -> int | None:
+        if instruction.operation != operation:
+            return None
+        if arg >= len(instruction.args) or instruction.args[arg] not in REGISTERS:
+            return None
+        return REGISTERS.index(instruction.args[arg])
+
+    def apply(self, registers: list[int]) -> bool:
+        register, value = self.source
+        source = registers[value] if register else value
+        factor = 1 if self.factor is None else registers[self.factor]
+        # non positive counters would wrap around rather than terminate
+        if source <= 0 or factor <= 0:
+            return False
+        registers[self.target] += source * factor
+        for counter in self.counters:
+            registers[counter] = 0
+        return True
+
 
 class Operation(StrEnum):
     CPY = auto()
@@ -80,6 +216,9 @@ class Operation(StrEnum):
     TGL = auto()
     OUT = auto()
 
+    def code(self) -> int:
+        return list(Operation).index(self)
+
     def toggle(self) -> Operation:
         match self:
             case self.CPY:
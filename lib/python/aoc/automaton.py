@@ -0,0 +1,122 @@
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable
+
+from .grid import DenseGrid
+
+type Cell = tuple[int, ...]
+
+
+def offsets(dimensions: int) -> list[Cell]:
+    """
+    Offsets to every neighbor of a cell in the given number of dimensions, including
+    diagonals, i.e. 3^dimensions - 1 of them.
+    """
+    result = itertools.product([-1, 0, 1], repeat=dimensions)
+    return [offset for offset in result if any(offset)]
+
+
+@dataclass
+class Automaton:
+    """
+    Steps every cell of a bounded grid at once. The rule is given the byte value of
+    a cell and those of its neighbors, which it can count, and returns the byte value
+    of the cell in the next generation.
+    """
+
+    grid: DenseGrid
+    rule: Callable[[int, list[int]], int]
+    diagonal: bool = True
+
+    def step(self) -> bool:
+        """
+        Advances a generation, returns whether any cell changed.
+        """
+        result = self.next(self.grid.cells)
+        changed = result != self.grid.cells
+        self.grid.cells = result
+        return changed
+
+    def next(self, cells: bytearray) -> bytearray:
+        """
+        Next generation of cells laid out like the grid, without modifying either.
+        """
+        rule = self.rule
+        adjacency = self.grid.neighbors(self.diagonal)
+        return bytearray(
+            [
+                rule(value, [cells[i] for i in neighbors])
+                for value, neighbors in zip(cells, adjacency)
+            ]
+        )
+
+    def run(self, generations: int) -> None:
+        for _ in range(generations):
+            self.step()
+
+
+@dataclass
+class SparseAutomaton:
+    """
+    Steps an unbounded set of active cells in any number of dimensions, neighborhoods
+    are defined by offsets so hex grids work as well using doubled coordinates. Work
+    scales with the number of active cells rather than the bounding volume. The rule
+    is given whether a cell is active and its number of active neighbors.
+
+    While running cells are packed into single ints over a box large enough to hold
+    every generation, so a neighbor is one int addition rather than building a tuple,
+    and the rule is tabulated by count so stepping is left to set operations.
+    """
+
+    active: set[Cell]
+    offsets: list[Cell]
+    rule: Callable[[bool, int], bool]
+
+    def step(self) -> None:
+        self.run(1)
+
+    def run(self, generations: int) -> None:
+        if len(self.active) == 0 or generations == 0:
+            return
+        reach = generations * max([max(map(abs, offset)) for offset in self.offsets])
+        dimensions = range(len(self.offsets[0]))
+        lows = [min([cell[i] for cell in self.active]) - reach for i in dimensions]
+        highs = [max([cell[i] for cell in self.active]) + reach for i in dimensions]
+        strides: list[int] = []
+        stride = 1
+        for low, high in zip(lows, highs):
+            strides.append(stride)
+            stride *= high - low + 1
+
+        def pack(cell: Cell, origin: list[int]) -> int:
+            return sum([(c - o) * s for c, o, s in zip(cell, origin, strides)])
+
+        zero = [0 for _ in dimensions]
+        offsets = [pack(offset, zero) for offset in self.offsets]
+        counts = range(len(offsets) + 1)
+        born = frozenset([count for count in counts if self.rule(False, count)])
+        survive = frozenset([count for count in counts if self.rule(True, count)])
+        assert 0 not in born, "inactive cells without neighbors must stay inactive"
+
+        active = set([pack(cell, lows) for cell in self.active])
+        for _ in range(generations):
+            neighbors = Counter(
+                [cell + offset for cell in active for offset in offsets]
+            )
+            births = [
+                cell
+                for cell, count in neighbors.items()
+                if count in born and cell not in active
+            ]
+            active = set([cell for cell in active if neighbors[cell] in survive])
+            active.update(births)
+
+        result: set[Cell] = set()
+        for cell in active:
+            values: list[int] = []
+            for low, high in zip(lows, highs):
+                cell, value = divmod(cell, high - low + 1)
+                values.append(value + low)
+            result.add(tuple(values))
+        self.active = result
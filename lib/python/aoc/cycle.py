@@ -0,0 +1,73 @@
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int
+    length: int
+
+    def index(self, n: int) -> int:
+        """
+        Earliest step whose state is the same as the state after n steps.
+        """
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+
+def detect[T](
+    start: T,
+    step: Callable[[T], T],
+    key: Callable[[T], Hashable] = lambda state: state,
+) -> tuple[Cycle, list[T]]:
+    """
+    Steps until a state repeats, indexing the key of every state in a dict so each
+    step is a constant time lookup. Returns the cycle along with every state before
+    the repeat, so the state after any n steps is states[cycle.index(n)].
+    """
+    seen: dict[Hashable, int] = dict()
+    states: list[T] = []
+    state, fingerprint = start, key(start)
+    while fingerprint not in seen:
+        seen[fingerprint] = len(states)
+        states.append(state)
+        state = step(state)
+        fingerprint = key(state)
+    first = seen[fingerprint]
+    return Cycle(first, len(states) - first), states
+
+
+def brent[T](start: T, step: Callable[[T], T]) -> Cycle:
+    """
+    Brent's algorithm, only ever holds 2 states so memory is constant regardless of
+    how long the cycle is, in exchange for stepping roughly 3 times as often as
+    detect. States must be immutable values compared with ==.
+    """
+    power, length = 1, 1
+    tortoise, hare = start, step(start)
+    while tortoise != hare:
+        if power == length:
+            tortoise, power, length = hare, power * 2, 0
+        hare = step(hare)
+        length += 1
+    tortoise, hare = start, start
+    for _ in range(length):
+        hare = step(hare)
+    first = 0
+    while tortoise != hare:
+        tortoise, hare = step(tortoise), step(hare)
+        first += 1
+    return Cycle(first, length)
+
+
+def jump[T](start: T, step: Callable[[T], T], n: int) -> T:
+    """
+    State after n steps using constant memory, only stepping through the prefix and
+    at most 1 cycle once it is known.
+    """
+    state = start
+    for _ in range(brent(start, step).index(n)):
+        state = step(state)
+    return state
@@ -1,3 +1,7 @@
+from dataclasses import dataclass
+from functools import cache
+from typing import Self
+
 from .point import Point, PointHelper
 
 type Grid[T] = dict[Point, T]
@@ -43,3 +47,93 @@ class GridHelper:
                 row.append(str(g.get((x, y), ".")))
             rows.append("".join(row))
         return "\n".join(rows)
+
+
+@dataclass
+class DenseGrid:
+    """
+    Fixed size grid of single character cells stored row major in a bytearray, so
+    a cell is an int index rather than a hashed Point and copies are a memcpy. Points
+    follow the orientation of Parser.grid, where the last row has y = 0.
+    """
+
+    width: int
+    height: int
+    cells: bytearray
+
+    @classmethod
+    def new(cls, lines: list[str]) -> Self:
+        width = len(lines[0])
+        assert all([len(line) == width for line in lines]), "rows must be equal width"
+        return cls(width, len(lines), bytearray("".join(lines), "ascii"))
+
+    @classmethod
+    def from_grid(cls, g: Grid[str], default: str = ".") -> Self:
+        xs, ys = GridHelper.xs(g), GridHelper.ys(g)
+        assert min(xs) >= 0 and min(ys) >= 0, "points must not be negative"
+        width, height = max(xs) + 1, max(ys) + 1
+        result = cls(width, height, bytearray(default * width * height, "ascii"))
+        for point, value in g.items():
+            result[point] = value
+        return result
+
+    def to_grid(self) -> Grid[str]:
+        return {self.point(i): chr(value) for i, value in enumerate(self.cells)}
+
+    def index(self, point: Point) -> int:
+        x, y = point
+        return (self.height - 1 - y) * self.width + x
+
+    def point(self, index: int) -> Point:
+        row, x = divmod(index, self.width)
+        return (x, self.height - 1 - row)
+
+    def neighbors(self, diagonal: bool) -> tuple[tuple[int, ...], ...]:
+        """
+        Indices of the in bounds neighbors of every cell, ordered by index. Shared by
+        all grids of the same size so only ever computed once.
+        """
+        return adjacency(self.width, self.height, diagonal)
+
+    def get(self, point: Point, default: str | None = None) -> str | None:
+        return self[point] if point in self else default
+
+    def count(self, value: str) -> int:
+        return self.cells.count(ord(value))
+
+    def copy(self) -> Self:
+        return type(self)(self.width, self.height, self.cells.copy())
+
+    def to_str(self) -> str:
+        rows: list[str] = []
+        for start in range(0, len(self.cells), self.width):
+            rows.append(self.cells[start : start + self.width].decode())
+        return "\n".join(rows)
+
+    def __contains__(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, point: Point) -> str:
+        return chr(self.cells[self.index(point)])
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        self.cells[self.index(point)] = ord(value)
+
+
+@cache
+def adjacency(width: int, height: int, diagonal: bool) -> tuple[tuple[int, ...], ...]:
+    offsets = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    if diagonal:
+        offsets += [(-1, -1), (1, -1), (-1, 1), (1, 1)]
+    result: list[tuple[int, ...]] = []
+    for row in range(height):
+        for x in range(width):
+            result.append(
+                tuple(
+                    (row + dr) * width + x + dx
+                    for dx, dr in offsets
+                    if 0 <= x + dx < width and 0 <= row + dr < height
+                )
+            )
+    return tuple(result)
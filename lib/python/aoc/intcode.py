@@ -1,17 +1,8 @@
-from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Protocol
-
-
-class Mode(Enum):
-    POSITION = auto()
-    IMMEDIATE = auto()
-    RELATIVE = auto()
-
-
-class Method(Enum):
-    GET = auto()
-    IDX = auto()
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Callable, Protocol
 
 
 class Bus(Protocol):
@@ -22,103 +13,187 @@ class Bus(Protocol):
     def add_output(self, value: int) -> None: ...
 
 
+@dataclass
+class InputBus:
+    inputs: list[int]
+    outputs: list[int] = field(default_factory=list)
+    index: int = 0
+
+    def active(self) -> bool:
+        return True
+
+    def get_input(self) -> int:
+        value = self.inputs[self.index]
+        self.index += 1
+        return value
+
+    def add_output(self, value: int) -> None:
+        self.outputs.append(value)
+
+
+@dataclass
+class NodeBus:
+    """
+    Bus of a computer within a Network, reading from an empty inbox returns -1 and
+    pauses the computer until something is sent to it.
+    """
+
+    inbox: deque[int]
+    outbox: list[int] = field(default_factory=list)
+    waiting: bool = False
+
+    def active(self) -> bool:
+        return not self.waiting
+
+    def get_input(self) -> int:
+        if len(self.inbox) == 0:
+            self.waiting = True
+            return -1
+        return self.inbox.popleft()
+
+    def add_output(self, value: int) -> None:
+        self.outbox.append(value)
+
+
+@cache
+def decode(code: int) -> tuple[int, int, int, int]:
+    """
+    Splits an instruction into its opcode and the modes of its 3 parameters. Depends
+    only on the value so results are cached by it, which stays correct even when a
+    program modifies its own instructions.
+
+    Modes: 0 = position, 1 = immediate, 2 = relative
+    """
+    opcode = code % 100
+    if opcode not in [1, 2, 3, 4, 5, 6, 7, 8, 9, 99]:
+        raise Exception(f"unknown opcode: {opcode}")
+    modes = ((code // 100) % 10, (code // 1_000) % 10, (code // 10_000) % 10)
+    for mode in modes:
+        if mode not in [0, 1, 2]:
+            raise Exception(f"unknown mode: {mode}")
+    return (opcode, *modes)
+
+
 @dataclass
 class Computer[T: Bus]:
     bus: T
     memory: list[int]
-    code: int = 0
-    param: int = 0
     pointer: int = 0
     base: int = 0
 
     def run(self) -> None:
-        while self.bus.active() and self.step():
-            pass
+        self.execute(single=False)
 
     def step(self) -> bool:
+        return self.execute(single=True)
+
+    def until_input(self) -> bool:
+        """
+        Runs until the next instruction reads input, without reading it, so the
+        shared prefix of a program can be run once then forked for every input.
+        Returns whether the program can continue.
+        """
+        while decode(self.memory[self.pointer])[0] != 3:
+            if not self.step():
+                return False
+        return True
+
+    def fork[U: Bus](self, bus: U) -> Computer[U]:
+        # memory is a flat list so a copy is a single memcpy, cheaper than tracking
+        # copy on write pages on every access of the interpreter loop
+        return Computer(bus, self.memory.copy(), self.pointer, self.base)
+
+    def batch(self, inputs: list[list[int]], processes: int = 1) -> list[list[int]]:
+        """
+        Runs a fork of the current state for each list of inputs, returning the
+        outputs of each. With more than 1 process forks are spread across a pool,
+        worth it only when there are many long running inputs.
+        """
+        if processes == 1:
+            return [self.fork_outputs(values) for values in inputs]
+        chunksize = max(len(inputs) // (processes * 4), 1)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            outputs = pool.map(self.fork_outputs, inputs, chunksize=chunksize)
+            return list(outputs)
+
+    def fork_outputs(self, inputs: list[int]) -> list[int]:
+        bus = InputBus(inputs)
+        self.fork(bus).run()
+        return bus.outputs
+
+    def execute(self, single: bool) -> bool:
+        """
+        Runs instructions until the program halts or the bus becomes inactive, or
+        for exactly one instruction if single. Returns whether the program can
+        continue. State lives in locals while running, the bus can only become
+        inactive as a result of input / output so it is checked after those.
+        """
+        bus, memory = self.bus, self.memory
+        pointer, base = self.pointer, self.base
+        running = single or bus.active()
         done = False
-        increment = True
-
-        self.code = self.memory[self.pointer]
-        self.param = 0
-
-        match self.code % 100:
-            case 1:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                self.set(self.next(Method.IDX), v1 + v2)
-            case 2:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                self.set(self.next(Method.IDX), v1 * v2)
-            case 3:
-                self.set(self.next(Method.IDX), self.bus.get_input())
-            case 4:
-                self.bus.add_output(self.next(Method.GET))
-            case 5:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                if v1 != 0:
-                    self.pointer = v2
-                    increment = False
-            case 6:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                if v1 == 0:
-                    self.pointer = v2
-                    increment = False
-            case 7:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                self.set(self.next(Method.IDX), 1 if v1 < v2 else 0)
-            case 8:
-                v1, v2 = self.next(Method.GET), self.next(Method.GET)
-                self.set(self.next(Method.IDX), 1 if v1 == v2 else 0)
-            case 9:
-                self.base += self.next(Method.GET)
-            case 99:
+        while running:
+            running = not single
+            opcode, m1, m2, m3 = decode(memory[pointer])
+
+            if opcode == 99:
                 done = True
-            case opcode:
-                raise Exception(f"unknown opcode: {opcode}")
+                break
 
-        self.pointer += 1 if increment else 0
+            if opcode == 3:
+                index = memory[pointer + 1] + (base if m1 == 2 else 0)
+                self.pointer, self.base = pointer + 2, base
+                value = bus.get_input()
+                pointer, base = self.pointer, self.base
+                if index >= len(memory):
+                    memory.extend([0] * (index + 1 - len(memory)))
+                memory[index] = value
+                running = running and bus.active()
+                continue
 
-        return not done
+            v1 = memory[pointer + 1]
+            if m1 != 1:
+                v1 += base if m1 == 2 else 0
+                v1 = memory[v1] if v1 < len(memory) else 0
+
+            if opcode == 4:
+                self.pointer, self.base = pointer + 2, base
+                bus.add_output(v1)
+                pointer, base = self.pointer, self.base
+                running = running and bus.active()
+                continue
+
+            if opcode == 9:
+                base += v1
+                pointer += 2
+                continue
+
+            v2 = memory[pointer + 2]
+            if m2 != 1:
+                v2 += base if m2 == 2 else 0
+                v2 = memory[v2] if v2 < len(memory) else 0
 
-    def next(self, method: Method) -> int:
-        mode = self.mode()
-        self.pointer += 1
-        value = self.memory[self.pointer]
-        match method:
-            case Method.IDX:
-                return self.index(mode, value)
-            case Method.GET:
-                match mode:
-                    case Mode.POSITION | Mode.RELATIVE:
-                        index = self.index(mode, value)
-                        return self.get(index)
-                    case Mode.IMMEDIATE:
-                        return value
-
-    def mode(self) -> Mode:
-        self.param += 1
-        n: int = 10 ** (self.param + 1)
-        value: int = (self.code // n) % 10
-        match value:
-            case 0:
-                return Mode.POSITION
-            case 1:
-                return Mode.IMMEDIATE
-            case 2:
-                return Mode.RELATIVE
-            case mode:
-                raise Exception(f"unknown mode: {mode}")
-
-    def index(self, mode: Mode, value: int) -> int:
-        offset = None
-        match mode:
-            case Mode.POSITION:
-                offset = 0
-            case Mode.RELATIVE:
-                offset = self.base
-            case Mode.IMMEDIATE:
-                raise Exception("immediate mode does not support indexing")
-        return offset + value
+            if opcode == 5:
+                pointer = v2 if v1 != 0 else pointer + 3
+            elif opcode == 6:
+                pointer = v2 if v1 == 0 else pointer + 3
+            else:
+                if opcode == 1:
+                    value = v1 + v2
+                elif opcode == 2:
+                    value = v1 * v2
+                elif opcode == 7:
+                    value = 1 if v1 < v2 else 0
+                else:
+                    value = 1 if v1 == v2 else 0
+                index = memory[pointer + 3] + (base if m3 == 2 else 0)
+                if index >= len(memory):
+                    memory.extend([0] * (index + 1 - len(memory)))
+                memory[index] = value
+                pointer += 4
+
+        self.pointer, self.base = pointer, base
+        return not done
 
     def get(self, index: int) -> int:
         if index < len(self.memory):
@@ -131,3 +206,70 @@ class Computer[T: Bus]:
             additional = index + 1 - len(self.memory)
             self.memory.extend([0] * additional)
         self.memory[index] = value
+
+
+class Network:
+    """
+    Runs computers cooperatively, each is given its address as its first input and
+    outputs packets of the form [destination, *values]. Only computers with pending
+    input are run, so work scales with traffic rather than with the number of nodes.
+    """
+
+    def __init__(self, memory: list[int], size: int, packet: int = 3):
+        self.packet: int = packet
+        self.computers: list[Computer[NodeBus]] = [
+            Computer(NodeBus(deque([address])), memory.copy())
+            for address in range(size)
+        ]
+        self.ready: deque[int] = deque(range(size))
+        self.queued: set[int] = set(range(size))
+
+    def send(self, destination: int, values: list[int]) -> None:
+        self.computers[destination].bus.inbox.extend(values)
+        if destination not in self.queued:
+            self.queued.add(destination)
+            self.ready.append(destination)
+
+    def run(
+        self,
+        on_packet: Callable[[list[int]], None],
+        on_idle: Callable[[], bool],
+    ) -> None:
+        """
+        on_packet receives packets addressed outside of the network, on_idle is called
+        once no computer has pending input and returns whether to keep running, which
+        only makes sense if it sent something.
+        """
+        size = self.packet
+        while True:
+            while len(self.ready) > 0:
+                address = self.ready.popleft()
+                self.queued.remove(address)
+                computer = self.computers[address]
+                computer.bus.waiting = False
+                computer.run()
+
+                outbox = computer.bus.outbox
+                end = len(outbox) - len(outbox) % size
+                for i in range(0, end, size):
+                    packet = outbox[i : i + size]
+                    if 0 <= packet[0] < len(self.computers):
+                        self.send(packet[0], packet[1:])
+                    else:
+                        on_packet(packet)
+                del outbox[:end]
+            if not on_idle():
+                return
+
+
+def batch(
+    memory: list[int], inputs: list[list[int]], processes: int = 1
+) -> list[list[int]]:
+    """
+    Outputs of running memory with each list of inputs. Everything before the first
+    input is only run once, including any outputs it produces.
+    """
+    start = Computer(InputBus([]), memory.copy())
+    start.until_input()
+    prefix = start.bus.outputs
+    return [prefix + outputs for outputs in start.batch(inputs, processes)]
@@ -1,9 +1,16 @@
 import argparse
+import mmap
+import re
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
-from .grid import Grid
+from .answer import parsing
+from .grid import DenseGrid, Grid
+
+INTEGER = re.compile(rb"-?\d+")
 
 
 @dataclass(frozen=True)
@@ -34,40 +41,52 @@ class Parser:
             assert self.file_name is not None
             return Path(self.file_name)
 
+    @parsing
     def string(self) -> str:
         return self.get_path().read_text().strip("\n")
 
+    @parsing
     def integer(self) -> int:
         return int(self.string())
 
+    @parsing
     def int_string(self) -> list[int]:
         return list(map(int, self.string()))
 
+    @parsing
     def entries(self) -> list[str]:
         return self.string().split()
 
+    @parsing
     def int_entries(self) -> list[int]:
         return list(map(int, self.entries()))
 
+    @parsing
     def csv(self) -> list[str]:
         data = self.string().split(",")
         return [datum.strip() for datum in data]
 
+    @parsing
     def int_csv(self) -> list[int]:
         return list(map(int, self.csv()))
 
+    @parsing
     def lines(self) -> list[str]:
         return self.string().split("\n")
 
+    @parsing
     def int_lines(self) -> list[int]:
         return list(map(int, self.lines()))
 
+    @parsing
     def nested_lines(self) -> list[list[str]]:
         return [[value for value in line] for line in self.lines()]
 
+    @parsing
     def line_groups(self) -> list[list[str]]:
         return [group.split("\n") for group in self.string().split("\n\n")]
 
+    @parsing
     def grid(self) -> Grid[str]:
         """
         Grids are often created bottom up, where an increase in y leads a value that is
@@ -86,3 +105,120 @@ class Parser:
             for x, value in enumerate(line):
                 grid[(x, y)] = value
         return grid
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Lazily yields the same lines as lines, reading one line of the file at a time.
+        Blank lines are held back until a later line shows they are not trailing.
+        """
+        with self.get_path().open() as f:
+            started, blank = False, 0
+            for line in f:
+                line = line.rstrip("\n")
+                if len(line) == 0:
+                    blank += 1 if started else 0
+                    continue
+                for _ in range(blank):
+                    yield ""
+                started, blank = True, 0
+                yield line
+
+    def iter_int_lines(self) -> Iterator[int]:
+        return map(int, self.iter_lines())
+
+    def iter_csv(self, size: int = 1 << 16) -> Iterator[str]:
+        """
+        Lazily yields the same fields as csv, reading the file in chunks of size so a
+        single very long line is never held in memory at once.
+        """
+        with self.get_path().open() as f:
+            partial = ""
+            for chunk in iter(lambda: f.read(size), ""):
+                fields = (partial + chunk).split(",")
+                partial = fields.pop()
+                for field in fields:
+                    yield field.strip()
+            yield partial.strip()
+
+    def iter_int_csv(self) -> Iterator[int]:
+        return map(int, self.iter_csv())
+
+    def iter_groups(self) -> Iterator[list[str]]:
+        """
+        Lazily yields the same groups as line_groups, holding only one in memory.
+        """
+        group: list[str] = []
+        for line in self.iter_lines():
+            if len(line) == 0 and len(group) > 0:
+                yield group
+                group = []
+            else:
+                group.append(line)
+        if len(group) > 0:
+            yield group
+
+    @contextmanager
+    def mapped(self) -> Iterator[bytes | mmap.mmap]:
+        """
+        Read only memory map of the file, pages are only read in as they are accessed
+        and nothing is copied into Python objects until it is sliced out.
+        """
+        with self.get_path().open("rb") as f:
+            if f.seek(0, 2) == 0:
+                # empty files can not be mapped
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+    def byte_lines(self) -> Iterator[bytes]:
+        """
+        Lazily yields the same lines as lines as bytes, copying only one at a time.
+        """
+        with self.mapped() as data:
+            start, end = 0, len(data)
+            while start < end and data[start] == ord("\n"):
+                start += 1
+            while end > start and data[end - 1] == ord("\n"):
+                end -= 1
+            while start < end:
+                index = data.find(b"\n", start, end)
+                index = end if index == -1 else index
+                yield data[start:index]
+                start = index + 1
+
+    @parsing
+    def ints(self) -> list[int]:
+        """
+        Every signed integer in the file in order, matched directly against the mapped
+        bytes so only the integers themselves are ever copied out of the file.
+        """
+        with self.mapped() as data:
+            return [int(match[0]) for match in INTEGER.finditer(data)]
+
+    @parsing
+    def int_rows(self) -> list[list[int]]:
+        """
+        Signed integers of each line, for lines like: pos=<1,-2,3>, r=4 -> [1, -2, 3, 4]
+        """
+        return [
+            [int(match[0]) for match in INTEGER.finditer(line)]
+            for line in self.byte_lines()
+        ]
+
+    @parsing
+    def int_tuples(self, width: int) -> list[tuple[int, ...]]:
+        rows = self.int_rows()
+        for row in rows:
+            assert len(row) == width, f"expected {width} integers: {row}"
+        return [tuple(row) for row in rows]
+
+    @parsing
+    def dense_grid(self) -> DenseGrid:
+        cells, widths = bytearray(), set[int]()
+        for line in self.byte_lines():
+            cells += line
+            widths.add(len(line))
+        assert len(widths) == 1, "rows must be equal width"
+        width = widths.pop()
+        return DenseGrid(width, len(cells) // width, cells)
@@ -1,4 +1,6 @@
 import heapq
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Callable
 
@@ -6,49 +8,198 @@ from typing import Callable
 @dataclass(frozen=True)
 class Search[T]:
     start: T
-    end: T
     neighbors: Callable[[T], list[T]]
+    done: Callable[[T], bool] = lambda _: False
 
     def bfs(self) -> int | None:
-        return self.traverse(front=True)
+        """
+        Length of the shortest path to a state that is done.
+        """
+        if self.done(self.start):
+            return 0
+        queue: deque[tuple[int, T]] = deque([(0, self.start)])
+        seen: set[T] = set([self.start])
+        while len(queue) > 0:
+            length, item = queue.popleft()
+            for adjacent in self.neighbors(item):
+                if adjacent in seen:
+                    continue
+                # first time any state is reached in a BFS is via a shortest path
+                if self.done(adjacent):
+                    return length + 1
+                seen.add(adjacent)
+                queue.append((length + 1, adjacent))
+        return None
 
     def dfs(self) -> int | None:
-        return self.traverse(front=False)
+        """
+        Length of the first path found to a state that is done, which need not be the
+        shortest, in exchange only the current frontier of the search is kept around.
+        """
+        stack: list[tuple[int, T]] = [(0, self.start)]
+        seen: set[T] = set([self.start])
+        while len(stack) > 0:
+            length, item = stack.pop()
+            if self.done(item):
+                return length
+            for adjacent in self.neighbors(item):
+                if adjacent not in seen:
+                    seen.add(adjacent)
+                    stack.append((length + 1, adjacent))
+        return None
 
-    def traverse(self, front: bool) -> int | None:
-        queue: list[tuple[int, T]] = [(0, self.start)]
-        seen: set[T] = set()
+    def path(self) -> list[T] | None:
+        """
+        States along the shortest path from start to a state that is done, inclusive.
+        """
+        parents: dict[T, T] = dict()
+        queue: deque[T] = deque([self.start])
+        seen: set[T] = set([self.start])
         while len(queue) > 0:
-            # Remove from either the front (BFS) or back (DFS)
-            length, item = queue.pop(0 if front else -1)
-            if item in seen:
-                continue
-            seen.add(item)
-            if item == self.end:
-                return length
+            item = queue.popleft()
+            if self.done(item):
+                path: list[T] = [item]
+                while path[-1] in parents:
+                    path.append(parents[path[-1]])
+                return path[::-1]
             for adjacent in self.neighbors(item):
                 if adjacent not in seen:
-                    queue.append((length + 1, adjacent))
+                    seen.add(adjacent)
+                    parents[adjacent] = item
+                    queue.append(adjacent)
+        return None
+
+    def distances(self, limit: int | None = None) -> dict[T, int]:
+        """
+        Shortest distance to every reachable state, optionally only those within limit.
+        """
+        result: dict[T, int] = {self.start: 0}
+        queue: deque[T] = deque([self.start])
+        while len(queue) > 0:
+            item = queue.popleft()
+            length = result[item]
+            if limit is not None and length >= limit:
+                continue
+            for adjacent in self.neighbors(item):
+                if adjacent not in result:
+                    result[adjacent] = length + 1
+                    queue.append(adjacent)
+        return result
+
+    def bidirectional(
+        self, end: T, previous: Callable[[T], list[T]] | None = None
+    ) -> int | None:
+        """
+        Length of the shortest path from start to end, searching from both at once
+        and always expanding the smaller frontier. Previous gives the states leading
+        to a state, defaults to neighbors which is only valid if moves are reversible.
+        """
+        if self.start == end:
+            return 0
+        backward = self.neighbors if previous is None else previous
+        forward_seen: dict[T, int] = {self.start: 0}
+        backward_seen: dict[T, int] = {end: 0}
+        forward_front: list[T] = [self.start]
+        backward_front: list[T] = [end]
+        while len(forward_front) > 0 and len(backward_front) > 0:
+            if len(forward_front) <= len(backward_front):
+                forward_front, result = Search.expand(
+                    forward_front, forward_seen, backward_seen, self.neighbors
+                )
+            else:
+                backward_front, result = Search.expand(
+                    backward_front, backward_seen, forward_seen, backward
+                )
+            if result is not None:
+                return result
         return None
 
+    @staticmethod
+    def expand(
+        front: list[T],
+        seen: dict[T, int],
+        other: dict[T, int],
+        neighbors: Callable[[T], list[T]],
+    ) -> tuple[list[T], int | None]:
+        # whole level is expanded since the first meeting need not be the shortest
+        result: int | None = None
+        next_front: list[T] = []
+        for item in front:
+            length = seen[item] + 1
+            for adjacent in neighbors(item):
+                if adjacent in other:
+                    total = length + other[adjacent]
+                    result = total if result is None else min(result, total)
+                if adjacent not in seen:
+                    seen[adjacent] = length
+                    next_front.append(adjacent)
+        return next_front, result
+
 
 @dataclass(frozen=True)
 class Dijkstra[T]:
+    """
+    Providing a heuristic turns this into A*, it must never overestimate the
+    remaining cost to a done state and should be consistent, i.e. never decrease
+    by more than the cost of a move, otherwise results may not be the minimum.
+    """
+
     start: T
-    done: Callable[[T], bool]
     neighbors: Callable[[T], list[tuple[int, T]]]
+    done: Callable[[T], bool] = lambda _: False
+    heuristic: Callable[[T], int] = lambda _: 0
 
     def run(self) -> int | None:
-        queue: list[tuple[int, T]] = [(0, self.start)]
-        seen: set[T] = set()
-        while len(queue) > 0:
-            value, item = heapq.heappop(queue)
-            if item in seen:
-                continue
-            seen.add(item)
+        for value, item in self.settle():
             if self.done(item):
                 return value
-            for cost, adjacent in self.neighbors(item):
-                if adjacent not in seen:
-                    heapq.heappush(queue, (value + cost, adjacent))
         return None
+
+    def distances(self, targets: set[T] | None = None) -> dict[T, int]:
+        """
+        Lowest cost of every reachable state, or if targets are given of the states
+        settled by the time all of them are, which includes every reachable target.
+        """
+        result: dict[T, int] = dict()
+        remaining = None if targets is None else set(targets)
+        for value, item in self.settle():
+            result[item] = value
+            if remaining is not None:
+                remaining.discard(item)
+                if len(remaining) == 0:
+                    break
+        return result
+
+    def settle(self) -> Iterator[tuple[int, T]]:
+        # a state is only queued when it improves on its best known cost, so the
+        # queue holds at most one entry per state & cost and stale ones are skipped
+        best: dict[T, int] = {self.start: 0}
+        queue: list[tuple[int, int, T]] = [(self.heuristic(self.start), 0, self.start)]
+        while len(queue) > 0:
+            _, value, item = heapq.heappop(queue)
+            if value > best[item]:
+                continue
+            yield value, item
+            for cost, adjacent in self.neighbors(item):
+                total = value + cost
+                if adjacent not in best or total < best[adjacent]:
+                    best[adjacent] = total
+                    estimate = total + self.heuristic(adjacent)
+                    heapq.heappush(queue, (estimate, total, adjacent))
+
+    @staticmethod
+    def pairs(
+        points: list[T], neighbors: Callable[[T], list[tuple[int, T]]]
+    ) -> dict[tuple[T, T], int]:
+        """
+        Lowest cost between every ordered pair of distinct connected points, running
+        one search per point that stops once all other points are settled.
+        """
+        result: dict[tuple[T, T], int] = dict()
+        targets = set(points)
+        for start in points:
+            distances = Dijkstra[T](start=start, neighbors=neighbors).distances(targets)
+            for end in points:
+                if end != start and end in distances:
+                    result[(start, end)] = distances[end]
+        return result
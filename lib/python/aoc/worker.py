@@ -0,0 +1,52 @@
+import contextlib
+import gc
+import importlib.util
+import io
+import json
+import sys
+import traceback
+from pathlib import Path
+
+
+def main() -> None:
+    """
+    Long lived process which runs solvers in process, avoiding interpreter startup and
+    library imports for every day. Reads one request per line from stdin of the form:
+    {"solver": "2016/12/solver.py", "args": ["--test"]}, and responds with one line
+    per request of the form: {"output": "...", "error": null}.
+    """
+    for line in sys.stdin:
+        request = json.loads(line)
+        response = run(Path(request["solver"]), request["args"])
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+def run(solver: Path, args: list[str]) -> dict[str, str | None]:
+    argv, path = sys.argv, sys.path[0]
+    # AdventData relies on both of these to determine which file to read
+    sys.argv = [str(solver)] + args
+    sys.path[0] = str(solver.parent.resolve())
+
+    name = "solver_" + "_".join(solver.parent.parts)
+    output, error = io.StringIO(), None
+    try:
+        spec = importlib.util.spec_from_file_location(name, solver)
+        assert spec is not None and spec.loader is not None, f"invalid: {solver}"
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        with contextlib.redirect_stdout(output):
+            spec.loader.exec_module(module)
+            module.main()
+    except (Exception, SystemExit):
+        error = traceback.format_exc()
+    finally:
+        sys.modules.pop(name, None)
+        sys.argv, sys.path[0] = argv, path
+        # do not let garbage from one day get collected while timing the next
+        gc.collect()
+    return dict(output=output.getvalue(), error=error)
+
+
+if __name__ == "__main__":
+    main()
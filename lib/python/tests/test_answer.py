@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from aoc import answer
 
@@ -10,3 +12,61 @@ def test_correct() -> None:
 def test_incorrect() -> None:
     with pytest.raises(Exception):
         answer.part1(2, -2)
+
+
+def test_timer(capsys: pytest.CaptureFixture[str]) -> None:
+    @answer.timer
+    def main() -> None:
+        answer.parsed()
+        with answer.phase(1):
+            answer.part1(1, 1)
+        with answer.phase(2):
+            # parsing once solving has started is part of solving
+            answer.parsed()
+            time.sleep(0.01)
+            answer.part2(2, 2)
+
+    main()
+    output = capsys.readouterr().out.splitlines()
+    assert ["Part 1: 1", "Part 2: 2"] == output[:2]
+    total = int(output[2].split("Runtime (ns): ")[1])
+    phases = read_phases(output[3])
+    assert ["parse", "part1", "part2"] == list(phases)
+    assert phases["part2"] >= 10_000_000 > phases["part1"] + phases["parse"]
+    assert sum(phases.values()) <= total
+
+
+def test_timer_answers_together(capsys: pytest.CaptureFixture[str]) -> None:
+    @answer.timer
+    def main() -> None:
+        answer.parsed()
+        part1, part2 = 1, 2
+        time.sleep(0.01)
+        answer.part1(1, part1)
+        answer.part2(2, part2)
+
+    main()
+    output = capsys.readouterr().out.splitlines()
+    # without phases the time between answers says nothing about either part
+    phases = read_phases(output[3])
+    assert ["parse"] == list(phases)
+    assert phases["parse"] < 10_000_000
+
+
+def read_phases(line: str) -> dict[str, int]:
+    assert line.startswith("Phases (ns): ")
+    entries = [entry.split("=") for entry in line.split(": ")[1].split()]
+    return {name: int(ns) for name, ns in entries}
+
+
+def test_parsing() -> None:
+    @answer.parsing
+    def read() -> int:
+        return 1
+
+    answer.clock = answer.Clock(0, 0)
+    try:
+        assert 1 == read()
+        assert answer.clock.parsed > 0
+    finally:
+        answer.clock = None
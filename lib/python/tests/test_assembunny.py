@@ -0,0 +1,38 @@
+from aoc.assembunny import Computer
+
+
+def test_run() -> None:
+    lines = ["cpy 41 a", "inc a", "inc a", "dec a", "jnz a 2", "dec a"]
+    computer = Computer.new(dict())
+    assert computer.run(lines)
+    assert 42 == computer.get("a")
+
+
+def test_toggle() -> None:
+    lines = ["cpy 2 a", "tgl a", "tgl a", "tgl a", "cpy 1 a", "dec a", "dec a"]
+    computer = Computer.new(dict())
+    assert computer.run(lines)
+    assert 3 == computer.get("a")
+
+
+def test_output() -> None:
+    lines = ["cpy a b", "out b", "inc b", "out b", "dec b", "jnz 1 -4"]
+    computer = Computer.new(dict(a=0))
+    assert computer.run(lines)
+    assert [0, 1] * 50 == computer.outputs
+    assert not Computer.new(dict(a=1)).run(lines)
+
+
+def test_multiply() -> None:
+    lines = ["cpy 3 b", "cpy 4 d", "cpy b c", "inc a", "dec c", "jnz c -2"]
+    lines += ["dec d", "jnz d -5"]
+    computer = Computer.new(dict(a=1))
+    assert computer.run(lines)
+    assert [13, 3, 0, 0] == [computer.get(name) for name in "abcd"]
+
+
+def test_toggle_loop() -> None:
+    lines = ["cpy 3 b", "cpy 2 c", "tgl c", "cpy 0 c", "inc a", "dec b", "jnz b -2"]
+    computer = Computer.new(dict())
+    assert computer.run(lines)
+    assert -3 == computer.get("a")
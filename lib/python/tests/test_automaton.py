@@ -0,0 +1,63 @@
+from aoc.automaton import Automaton, Cell, SparseAutomaton, offsets
+from aoc.grid import DenseGrid
+
+ON, OFF = ord("#"), ord(".")
+
+
+def life(value: int, neighbors: list[int]) -> int:
+    count = neighbors.count(ON)
+    return ON if count == 3 or (value == ON and count == 2) else OFF
+
+
+def test_offsets() -> None:
+    assert 8 == len(offsets(2))
+    assert 80 == len(offsets(4))
+    assert (0, 0) not in offsets(2)
+
+
+def test_automaton() -> None:
+    blinker = Automaton(DenseGrid.new(["...", "###", "..."]), life)
+    assert blinker.step()
+    assert ".#.\n.#.\n.#." == blinker.grid.to_str()
+    blinker.run(3)
+    assert "...\n###\n..." == blinker.grid.to_str()
+    block = Automaton(DenseGrid.new(["##", "##"]), life)
+    assert not block.step()
+
+
+def test_sparse_automaton() -> None:
+    glider: set[Cell] = set([(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+    state = SparseAutomaton(
+        glider,
+        offsets(2),
+        lambda active, count: count == 3 or (active and count == 2),
+    )
+    state.run(4)
+    assert set([(x + 1, y + 1) for x, y in glider]) == state.active
+
+
+def test_sparse_automaton_dimensions() -> None:
+    # example of 2020/17, where cubes in 3 & 4 dimensions follow the rules of life
+    cubes = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+    for dimensions, expected in [(3, 112), (4, 848)]:
+        padding = (0,) * (dimensions - 2)
+        state = SparseAutomaton(
+            set([cube + padding for cube in cubes]),
+            offsets(dimensions),
+            lambda active, count: count == 3 or (active and count == 2),
+        )
+        state.run(6)
+        assert expected == len(state.active)
+
+
+def test_sparse_automaton_step() -> None:
+    # survivors need 1 or 2 neighbors & births need exactly 2, cells diagonal to the
+    # ends are born while those beside the middle see 3 active cells
+    line: set[Cell] = set([(0, 0), (1, 0), (2, 0)])
+    state = SparseAutomaton(
+        line,
+        offsets(2),
+        lambda active, count: count == 2 or (active and count == 1),
+    )
+    state.step()
+    assert line | set([(0, -1), (0, 1), (2, -1), (2, 1)]) == state.active
@@ -0,0 +1,37 @@
+from aoc.cycle import Cycle, brent, detect, jump
+
+
+def step(value: int) -> int:
+    # 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 7 -> 3
+    return 3 if value == 7 else value + 1
+
+
+def test_index() -> None:
+    cycle = Cycle(3, 5)
+    assert 2 == cycle.index(2)
+    assert 7 == cycle.index(7)
+    assert 3 == cycle.index(8)
+    assert 4 == cycle.index(1_000_000_004)
+
+
+def test_detect() -> None:
+    cycle, states = detect(0, step)
+    assert Cycle(3, 5) == cycle
+    assert [0, 1, 2, 3, 4, 5, 6, 7] == states
+    assert 4 == states[cycle.index(1_000_000_004)]
+
+
+def test_detect_key() -> None:
+    cycle, states = detect([0], lambda values: [step(values[0])], key=tuple)
+    assert Cycle(3, 5) == cycle
+    assert [7] == states[-1]
+
+
+def test_brent() -> None:
+    assert Cycle(3, 5) == brent(0, step)
+    assert Cycle(0, 1) == brent(0, lambda value: value)
+
+
+def test_jump() -> None:
+    assert 2 == jump(0, step, 2)
+    assert 4 == jump(0, step, 1_000_000_004)
@@ -0,0 +1,38 @@
+from aoc.grid import DenseGrid, Grid
+
+
+def test_dense_points() -> None:
+    grid = DenseGrid.new(["ab", "cd", "ef"])
+    assert (2, 3) == (grid.width, grid.height)
+    assert "e" == grid[(0, 0)]
+    assert "b" == grid[(1, 2)]
+    assert 1 == grid.index((1, 2))
+    assert (1, 2) == grid.point(1)
+    assert (2, 0) not in grid
+    assert grid.get((0, -1)) is None
+
+
+def test_dense_update() -> None:
+    grid = DenseGrid.new(["..", ".#"])
+    copy = grid.copy()
+    grid[(0, 1)] = "#"
+    assert 2 == grid.count("#")
+    assert 1 == copy.count("#")
+    assert "#.\n.#" == grid.to_str()
+
+
+def test_dense_conversion() -> None:
+    grid: Grid[str] = {(0, 0): "a", (1, 1): "b"}
+    dense = DenseGrid.from_grid(grid)
+    assert ".b\na." == dense.to_str()
+    assert {(0, 0): "a", (1, 0): ".", (0, 1): ".", (1, 1): "b"} == dense.to_grid()
+
+
+def test_dense_neighbors() -> None:
+    grid = DenseGrid.new(["abc", "def", "ghi"])
+    direct = grid.neighbors(False)
+    assert set([1, 3]) == set(direct[0])
+    assert set([1, 3, 5, 7]) == set(direct[4])
+    diagonal = grid.neighbors(True)
+    assert set([1, 3, 4]) == set(diagonal[0])
+    assert 8 == len(diagonal[4])
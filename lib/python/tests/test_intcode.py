@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+
+from aoc.intcode import Computer, Network, batch
+
+
+@dataclass
+class ListBus:
+    inputs: list[int] = field(default_factory=list)
+    outputs: list[int] = field(default_factory=list)
+
+    def active(self) -> bool:
+        return True
+
+    def get_input(self) -> int:
+        return self.inputs.pop(0)
+
+    def add_output(self, value: int) -> None:
+        self.outputs.append(value)
+
+
+def test_memory() -> None:
+    memory = [1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50]
+    Computer(ListBus(), memory).run()
+    assert [3500, 9, 10, 70, 2, 3, 11, 0, 99, 30, 40, 50] == memory
+
+
+def test_compare() -> None:
+    memory = [3, 3, 1107, -1, 8, 3, 4, 3, 99]
+    assert [1] == run(memory, [5])
+    assert [0] == run(memory, [8])
+
+
+def test_jump() -> None:
+    memory = [3, 12, 6, 12, 15, 1, 13, 14, 13, 4, 13, 99, -1, 0, 1, 9]
+    assert [0] == run(memory, [0])
+    assert [1] == run(memory, [7])
+
+
+def test_relative() -> None:
+    memory = [109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0]
+    memory += [99]
+    assert memory == run(memory, [])
+
+
+def test_large() -> None:
+    assert [1125899906842624] == run([104, 1125899906842624, 99], [])
+    assert [1219070632396864] == run([1102, 34915192, 34915192, 7, 4, 7, 99, 0], [])
+
+
+def test_step() -> None:
+    computer = Computer(ListBus(), [1101, 2, 3, 5, 99, 0])
+    assert computer.step()
+    assert 4 == computer.pointer
+    assert 5 == computer.get(5)
+    assert not computer.step()
+
+
+def run(memory: list[int], inputs: list[int]) -> list[int]:
+    bus = ListBus(inputs=inputs.copy())
+    Computer(bus, memory.copy()).run()
+    return bus.outputs
+
+
+def test_fork() -> None:
+    # outputs 10 then double its input
+    memory = [104, 10, 3, 11, 1002, 11, 2, 11, 4, 11, 99, 0]
+    start = Computer(ListBus(), memory)
+    assert start.until_input()
+    assert [10] == start.bus.outputs
+
+    first, second = ListBus(inputs=[3]), ListBus(inputs=[5])
+    start.fork(first).run()
+    start.fork(second).run()
+    assert [6] == first.outputs
+    assert [10] == second.outputs
+    assert 0 == start.get(11)
+    assert [10] == start.bus.outputs
+
+
+def test_batch() -> None:
+    memory = [3, 3, 1107, -1, 8, 3, 4, 3, 99]
+    inputs = [[value] for value in range(5, 12)]
+    expected = [[1], [1], [1], [0], [0], [0], [0]]
+    assert expected == batch(memory, inputs)
+    assert expected == batch(memory, inputs, processes=2)
+
+
+def test_network() -> None:
+    # forwards packets to address + 1, incrementing y along the way
+    memory = [3, 100, 3, 101, 1008, 101, -1, 102, 1005, 102, 2, 3, 103]
+    memory += [1001, 100, 1, 104, 4, 104, 4, 101, 1001, 103, 1, 103, 4, 103]
+    memory += [1105, 1, 2]
+    network = Network(memory, 3)
+    network.send(0, [7, 10])
+    packets: list[list[int]] = []
+    idles: list[int] = []
+
+    def on_idle() -> bool:
+        idles.append(len(packets))
+        if len(idles) == 1:
+            network.send(1, [8, 20])
+        return len(idles) < 2
+
+    network.run(packets.append, on_idle)
+    assert [[3, 7, 13], [3, 8, 22]] == packets
+    assert [1, 2] == idles
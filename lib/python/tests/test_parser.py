@@ -58,6 +58,59 @@ def test_line_groups(tmp_path: Path) -> None:
     assert [["abcd", "efg"], ["hij"]] == parser(path).line_groups()
 
 
+def test_dense_grid(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["ab", "cd"])
+    grid = parser(path).dense_grid()
+    assert grid.to_grid() == parser(path).grid()
+
+
+def test_iter_lines(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["", "abcd", "", "efg", "", ""])
+    assert parser(path).lines() == list(parser(path).iter_lines())
+
+
+def test_iter_int_lines(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["123", "-12", "1", ""])
+    assert [123, -12, 1] == list(parser(path).iter_int_lines())
+
+
+def test_iter_csv(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["abcd, efg,h", ""])
+    assert ["abcd", "efg", "h"] == list(parser(path).iter_csv(size=3))
+
+
+def test_iter_int_csv(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["123,-12,1"])
+    assert [123, -12, 1] == list(parser(path).iter_int_csv())
+
+
+def test_iter_groups(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["abcd", "efg", "", "hij", "", "", "k"])
+    assert parser(path).line_groups() == list(parser(path).iter_groups())
+
+
+def test_byte_lines(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["", "abcd", "", "efg", "", ""])
+    assert [b"abcd", b"", b"efg"] == list(parser(path).byte_lines())
+    empty = new_file(tmp_path, [])
+    assert [] == list(parser(empty).byte_lines())
+
+
+def test_ints(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["pos=<12,-3>", "r=40 x-y", "1518-11-01 --7 8-"])
+    assert [12, -3, 40, 1518, -11, -1, -7, 8] == parser(path).ints()
+
+
+def test_int_rows(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["", "#1 @ 3,-2: 4x4", "none", "-5", ""])
+    assert [[1, 3, -2, 4, 4], [], [-5]] == parser(path).int_rows()
+
+
+def test_int_tuples(tmp_path: Path) -> None:
+    path = new_file(tmp_path, ["pos=<1,-2,3>, r=4", "pos=<0,0,0>, r=10"])
+    assert [(1, -2, 3, 4), (0, 0, 0, 10)] == parser(path).int_tuples(4)
+
+
 def new_file(path: Path, lines: list[str]) -> Path:
     data = path / "data.txt"
     with data.open("w") as f:
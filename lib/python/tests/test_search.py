@@ -0,0 +1,98 @@
+from aoc.point import Point, PointHelper
+from aoc.search import Dijkstra, Search
+
+MAZE = [
+    "..#....",
+    ".##.##.",
+    "....#..",
+    "##.##.#",
+    "......#",
+]
+
+
+def neighbors(point: Point) -> list[Point]:
+    result: list[Point] = []
+    for x, y in PointHelper.neighbors(point):
+        if 0 <= y < len(MAZE) and 0 <= x < len(MAZE[y]) and MAZE[y][x] == ".":
+            result.append((x, y))
+    return result
+
+
+def search(end: Point) -> Search[Point]:
+    return Search[Point](
+        start=(0, 0),
+        neighbors=neighbors,
+        done=lambda point: point == end,
+    )
+
+
+def test_bfs() -> None:
+    assert 0 == search((0, 0)).bfs()
+    assert 8 == search((0, 4)).bfs()
+    assert 10 == search((6, 0)).bfs()
+    assert search((2, 0)).bfs() is None
+
+
+def test_dfs() -> None:
+    result = search((6, 0)).dfs()
+    assert result is not None and result >= 10
+    assert search((2, 0)).dfs() is None
+
+
+def test_path() -> None:
+    path = search((3, 2)).path()
+    assert path is not None
+    assert [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (3, 2)] == path
+    assert search((2, 0)).path() is None
+
+
+def test_distances() -> None:
+    distances = search((0, 0)).distances()
+    assert 0 == distances[(0, 0)]
+    assert 10 == distances[(6, 0)]
+    assert (2, 0) not in distances
+    expected: list[Point] = [(0, 0), (1, 0), (0, 1), (0, 2), (1, 2)]
+    assert set(expected) == set(search((0, 0)).distances(3))
+
+
+def test_bidirectional() -> None:
+    assert 0 == search((0, 0)).bidirectional((0, 0))
+    assert 8 == search((0, 4)).bidirectional((0, 4))
+    assert 10 == search((6, 0)).bidirectional((6, 0))
+    assert search((9, 9)).bidirectional((9, 9)) is None
+
+
+def weighted(point: Point) -> list[tuple[int, Point]]:
+    # moving down is more expensive than any other direction
+    return [(2 if y > point[1] else 1, (x, y)) for x, y in neighbors(point)]
+
+
+def test_heuristic() -> None:
+    for end in [(0, 4), (6, 0), (5, 4)]:
+        dijkstra = Dijkstra[Point](
+            start=(0, 0),
+            neighbors=lambda point: [(1, adjacent) for adjacent in neighbors(point)],
+            done=lambda point: point == end,
+            heuristic=lambda point: PointHelper.manhattan(point, end),
+        )
+        assert search(end).bfs() == dijkstra.run()
+
+
+def test_weighted_distances() -> None:
+    distances = Dijkstra[Point](start=(0, 0), neighbors=weighted).distances()
+    assert 0 == distances[(0, 0)]
+    assert 12 == distances[(0, 4)]
+    assert 12 == distances[(6, 0)]
+    assert (2, 0) not in distances
+    partial = Dijkstra[Point](start=(0, 0), neighbors=weighted).distances({(1, 2)})
+    assert 5 == partial[(1, 2)]
+    assert (6, 0) not in partial
+
+
+def test_pairs() -> None:
+    pairs = Dijkstra[Point].pairs([(0, 0), (6, 0), (0, 4)], weighted)
+    assert 12 == pairs[((0, 0), (6, 0))]
+    assert 12 == pairs[((6, 0), (0, 0))]
+    assert 12 == pairs[((0, 0), (0, 4))]
+    assert 8 == pairs[((0, 4), (0, 0))]
+    assert 6 == len(pairs)
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+from aoc import worker
+
+
+def test_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    solver = new_day(tmp_path, "answer.part1(6, sum(Parser().int_lines()))")
+    response = worker.run(solver, [])
+    assert response["error"] is None
+    assert "Part 1: 6" in str(response["output"])
+    assert "Runtime (ns): " in str(response["output"])
+
+
+def test_run_test_flag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    solver = new_day(tmp_path, "answer.part1(2, sum(Parser().int_lines()))")
+    response = worker.run(solver, ["--test"])
+    assert response["error"] is None
+    assert "Part 1: 2" in str(response["output"])
+
+
+def test_run_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    solver = new_day(tmp_path, "answer.part1(1, sum(Parser().int_lines()))")
+    response = worker.run(solver, [])
+    assert "expected 1 got 6" in str(response["error"])
+
+
+def new_day(root: Path, body: str) -> Path:
+    data = root / "data" / "2015" / "01"
+    data.mkdir(parents=True)
+    (data / "data.txt").write_text("1\n2\n3\n")
+    (data / "sample.txt").write_text("1\n1\n")
+
+    solver = Path("2015") / "01" / "solver.py"
+    (root / solver).parent.mkdir(parents=True)
+    (root / solver).write_text(
+        "\n".join(
+            [
+                "from aoc import answer",
+                "from aoc.parser import Parser",
+                "",
+                "",
+                "@answer.timer",
+                "def main() -> None:",
+                f"    {body}",
+                "",
+            ]
+        )
+    )
+    return solver
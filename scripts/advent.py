@@ -1,17 +1,23 @@
 #!/usr/bin/env python
 
 import json
+from pathlib import Path
 
 import click
 
 from args.generate_template import GenerateName, GenerateTemplate
 from args.language_type import LanguageType
 from args.run_template import RunName, RunTemplate
+from args.shard_type import ShardType
 from command.command import Command
 from component.day_factory import DayFactory
+from component.history import ShardHistory
 from component.language_factory import LanguageFactory
 from component.language_strategy import LanguageStrategy, StrategyName
+from component.regression import Regression
 from language.language import Language
+from pojo.benchmark import Benchmark
+from pojo.shard import Shard
 
 
 @click.group(
@@ -25,8 +31,9 @@ def cli() -> None:
 
 @cli.command()
 @click.option("-l", "--language", type=LanguageType(), multiple=True)
+@click.option("-f", "--force", is_flag=True)
 @click.option("-i", "--info", is_flag=True)
-def build(language: tuple[Language, ...], info: bool) -> None:
+def build(language: tuple[Language, ...], force: bool, info: bool) -> None:
     """
     Build specified languages
     """
@@ -34,6 +41,7 @@ def build(language: tuple[Language, ...], info: bool) -> None:
 
     build = Build(
         languages=LanguageFactory().resolve(language),
+        force=force,
     )
     run_command(build, info)
 
@@ -46,6 +54,16 @@ def build(language: tuple[Language, ...], info: bool) -> None:
 @click.option("-s", "--strategy", type=click.Choice(StrategyName, case_sensitive=False))
 @click.option("-S", "--slow", type=int, default=100)
 @click.option("-T", "--test", is_flag=True)
+@click.option("-b", "--batch", is_flag=True)
+@click.option("-j", "--jobs", type=click.IntRange(min=1), default=1)
+@click.option("-I", "--isolate", is_flag=True)
+@click.option("-B", "--benchmark", is_flag=True)
+@click.option("-f", "--force", is_flag=True)
+@click.option("-r", "--record", is_flag=True)
+@click.option("-c", "--compare", type=str)
+@click.option("-F", "--fail-on-regression", type=click.FloatRange(min=0))
+@click.option("-p", "--shard", type=ShardType())
+@click.option("-w", "--weighted", is_flag=True)
 @click.option("-i", "--info", is_flag=True)
 def run(
     template: RunName | None,
@@ -55,6 +73,16 @@ def run(
     strategy: StrategyName | None,
     slow: int,
     test: bool,
+    batch: bool,
+    jobs: int,
+    isolate: bool,
+    benchmark: bool,
+    force: bool,
+    record: bool,
+    compare: str | None,
+    fail_on_regression: float | None,
+    shard: Shard | None,
+    weighted: bool,
     info: bool,
 ) -> None:
     """
@@ -88,7 +116,19 @@ def run(
         ),
         slow=slow,
         args=["--test"] if test else [],
-        save=template in [RunName.DAYS] and len(language) == 0,
+        save=template in [RunName.DAYS] and len(language) == 0 and shard is None,
+        batch=batch,
+        jobs=jobs,
+        isolate=isolate,
+        benchmark=Benchmark() if benchmark else None,
+        force=force,
+        record=record,
+        baseline=compare,
+        regression=(
+            None if fail_on_regression is None else Regression(fail_on_regression)
+        ),
+        shard=shard,
+        weighted=weighted,
     )
     run_command(runner, info)
 
@@ -139,6 +179,28 @@ def graph(archive: bool, info: bool) -> None:
     run_command(grapher, info)
 
 
+@cli.group()
+def history() -> None:
+    """
+    Manages saved runtimes
+    """
+
+
+@history.command()
+@click.argument("file", type=click.Path(exists=True, path_type=Path), nargs=-1)
+@click.option("-S", "--slow", type=int, default=100)
+@click.option("-i", "--info", is_flag=True)
+def merge(file: tuple[Path, ...], slow: int, info: bool) -> None:
+    """
+    Merges the runtimes of sharded runs into all.json & slow.json
+    """
+    from command.history import Merger
+
+    files = list(file) if len(file) > 0 else sorted(ShardHistory.DIR.glob("*.json"))
+    merger = Merger(files=files, slow=slow)
+    run_command(merger, info)
+
+
 def run_command(command: Command, info: bool) -> None:
     click.echo(json.dumps(command.info(), indent=2)) if info else command.run()
 
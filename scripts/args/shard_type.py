@@ -0,0 +1,23 @@
+from typing import override
+
+import click
+
+from pojo.shard import Shard
+
+
+class ShardType(click.ParamType):
+    name: str = "shard"
+
+    @override
+    def get_metavar(self, param: click.Parameter, ctx: click.Context) -> str | None:
+        return "I/N"
+
+    @override
+    def convert(
+        self, value: str, param: click.Parameter | None, ctx: click.Context | None
+    ) -> Shard:
+        try:
+            return Shard.parse(value)
+        except (AssertionError, ValueError):
+            message = f"{value} is not a valid shard, expected i/n with 1 <= i <= n"
+            self.fail(message, param, ctx)
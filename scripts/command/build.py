@@ -1,6 +1,11 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+from component.artifacts import Artifacts, forget, hash_paths
 from component.command import Executor
 from language.language import Language
 
@@ -10,43 +15,97 @@ class LanguageBuild:
     name: str
     build: list[list[str]]
     test: list[str]
+    language: Language
+    artifacts: Artifacts
     executor: Executor
+    force: bool
 
     def key(self) -> str:
         return self.name
 
-    def value(self) -> dict[str, str]:
+    def value(self) -> dict[str, str | bool]:
         return dict(
             build=" && ".join([" ".join(command) for command in self.build]),
             test=" ".join(self.test),
+            current=self.current(),
         )
 
-    def execute(self) -> None:
-        print(f"Setting up: {self.name}")
-        print("Building")
+    def execute(self) -> bool:
+        if self.current():
+            self.log("Up to date")
+            return False
+        self.log("Building")
         [self.executor.run(command) for command in self.build]
-        print("Testing")
+        self.log("Compiling days")
+        self.artifacts.build(self.language, self.executor)
+        self.log("Testing")
         self.executor.run(self.test)
+        return True
+
+    def current(self) -> bool:
+        return not self.force and self.artifacts.hashes.get(self.name) == self.digest()
+
+    def digest(self) -> str:
+        # whole day directories, solutions can have helper sources beside them
+        sources = [Path("lib") / self.name] + [
+            day.dir() for day in Artifacts.days(self.language)
+        ]
+        digest = hashlib.sha256(hash_paths(sources).encode())
+        digest.update(json.dumps([self.build, self.test]).encode())
+        return digest.hexdigest()
+
+    def log(self, message: str) -> None:
+        print(f"{self.executor.prefix}{message}")
 
 
 @dataclass(frozen=True)
 class Build:
+    """
+    Languages are independent of each other so they build concurrently, output of
+    each is prefixed by its name. Languages whose library, solutions & commands hash
+    the same as their last successful build are skipped unless forced.
+    """
+
     languages: list[Language]
+    force: bool
 
     def info(self) -> dict[str, Any]:
-        return {build.key(): build.value() for build in self.builds()}
+        builds = self.builds(Artifacts.load())
+        return {build.key(): build.value() for build in builds}
 
     def run(self) -> None:
-        [build.execute() for build in self.builds()]
+        artifacts = Artifacts.load()
+        builds = self.builds(artifacts)
+        with ThreadPoolExecutor(max_workers=max(len(builds), 1)) as pool:
+            futures = [pool.submit(build.execute) for build in builds]
+            wait(futures)
+
+        # hashed again since building may have changed what was hashed to check it,
+        # only once every build is done so no other thread is still using the hashes
+        forget()
+        failed: list[str] = []
+        for build, future in zip(builds, futures):
+            # failing commands exit, which the future holds onto as its exception
+            if future.exception() is not None:
+                failed.append(build.name)
+            elif future.result():
+                artifacts.hashes[build.name] = build.digest()
+        # languages that succeeded should not rebuild because another one failed
+        artifacts.save()
+        if len(failed) > 0:
+            print(f"Failed to build: {', '.join(failed)}")
+            exit(1)
 
-    def builds(self) -> list[LanguageBuild]:
-        executor = Executor()
+    def builds(self, artifacts: Artifacts) -> list[LanguageBuild]:
         return [
             LanguageBuild(
                 name=language.name,
                 build=language.build(),
                 test=language.test(),
-                executor=executor,
+                language=language,
+                artifacts=artifacts,
+                executor=Executor(prefix=f"[{language.name}] "),
+                force=self.force,
             )
             for language in self.languages
         ]
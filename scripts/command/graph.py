@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import plotly.express as px
 
+from component.database import Database
 from component.figure_saver import FigureKind, FigureProps, FigureSaver
 from component.history import History
 
@@ -27,6 +28,9 @@ class Grapher:
         runtimes = History("all").load(True)
         runtimes = pd.DataFrame([runtime.as_dict() for runtime in runtimes])
         self.create_graphs(runtimes)
+        series = Database().series()
+        if len(series) > 0:
+            self.saver.save(self.trend(runtimes.copy(), pd.DataFrame(series)))
 
     def create_graphs(self, runtimes: pd.DataFrame) -> None:
         self.saver.save(self.year_percentage(runtimes.copy()))
@@ -134,3 +138,32 @@ class Grapher:
             ),
             kind=FigureKind.MATPLOTLIB,
         )
+
+    def trend(self, runtimes: pd.DataFrame, series: pd.DataFrame) -> FigureProps:
+        # only the slowest days, plotting every day is unreadable
+        slowest = runtimes.nlargest(10, "runtime")[["year", "day", "language"]]
+        series = series.merge(slowest, on=["year", "day", "language"])
+        series["name"] = (
+            series["year"].astype(str)
+            + "/"
+            + series["day"].astype(str).str.zfill(2)
+            + " "
+            + series["language"]
+        )
+        trends = pd.pivot_table(
+            series,
+            index="run",
+            columns="name",
+            values="runtime",
+            aggfunc="mean",
+        )
+        return FigureProps(
+            name="trend_day",
+            figure=trends.plot.line(
+                marker="o",
+                legend=False,
+                figsize=(10, 6),
+            ),
+            kind=FigureKind.MATPLOTLIB,
+            legend=dict(loc="upper center", ncol=5),
+        )
@@ -0,0 +1,54 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from component.history import History
+
+
+@dataclass(frozen=True)
+class Merger:
+    """
+    Combines the output of every shard of a run into all.json & slow.json, each
+    runtime keeps the shard & machine it ran on since those can differ per entry.
+    """
+
+    files: list[Path]
+    slow: int
+
+    def info(self) -> dict[str, Any]:
+        return dict(
+            files=[str(file) for file in self.files],
+            slow=self.slow,
+        )
+
+    def run(self) -> None:
+        shards = [json.loads(file.read_text()) for file in self.files]
+        if len(shards) == 0:
+            raise Exception("Could not find any shards to merge")
+
+        counts = set([shard["shard"].split("/")[1] for shard in shards])
+        if len(counts) != 1:
+            raise Exception(f"Shards are from runs split differently: {counts}")
+        count = int(counts.pop())
+        found = sorted([shard["shard"] for shard in shards])
+        expected = sorted([f"{i}/{count}" for i in range(1, count + 1)])
+        if found != expected:
+            raise Exception(f"Expected shards {expected} but found {found}")
+        commits = set([shard["git"] for shard in shards])
+        if len(commits) != 1:
+            raise Exception(f"Shards ran against different commits: {commits}")
+
+        runtimes: list[dict[str, Any]] = []
+        for shard in shards:
+            for runtime in shard["runtimes"]:
+                metadata = dict(shard=shard["shard"], machine=shard["machine"])
+                runtimes.append(runtime | metadata)
+        runtimes.sort(
+            key=lambda runtime: (runtime["year"], runtime["day"], runtime["language"])
+        )
+
+        slow = [runtime for runtime in runtimes if runtime["runtime"] > self.slow]
+        History("all").write(runtimes)
+        History("slow").write(slow)
+        print(f"Merged {len(runtimes)} runtimes from {len(shards)} shards")
@@ -1,15 +1,27 @@
 import re
+import statistics
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import Any, ClassVar, Final
 
-from component.command import Executor
+from component.artifacts import Artifacts
+from component.command import Executor, Worker
+from component.database import Database
 from component.display_runtimes import Displayer
-from component.history import History
+from component.history import History, ShardHistory
 from component.language_strategy import LanguageStrategy
+from component.regression import Regression
+from component.results import Result
+from language.language import Language
+from language.python import Python
+from pojo.benchmark import Benchmark
 from pojo.day import Day
+from pojo.phases import Phases
 from pojo.problems import Problems
 from pojo.runtime_info import RuntimeInfo
+from pojo.shard import Shard
+from pojo.stats import Stats
 
 
 @dataclass(frozen=True)
@@ -20,7 +32,9 @@ class LanguageRunner:
     name: str
     times: int
     command: list[str]
-    executor: Executor
+    executor: Executor | Worker
+    benchmark: Benchmark | None
+    result: Result | None
 
     def as_dict(self) -> dict[str, Any]:
         return dict(
@@ -29,29 +43,64 @@ class LanguageRunner:
             name=self.name,
             times=self.times,
             command=" ".join(self.command),
+            benchmark=self.benchmark is not None,
+            cached=self.result is not None and self.result.file.is_file(),
         )
 
     def execute(self) -> RuntimeInfo:
-        print(f"Running {self.day.dir()} with {self.name} ({self.times})")
+        if self.benchmark is not None:
+            return self.measure(self.benchmark)
 
-        runtimes: list[float] = []
-        executions: list[float] = []
+        cached = None if self.result is None else self.result.get()
+        if cached is not None:
+            runtime_info, answers = cached
+            self.log(f"Cached {self.day.dir()} with {self.name}")
+            [self.log(answer) for answer in answers]
+            return runtime_info
+
+        self.log(f"Running {self.day.dir()} with {self.name} ({self.times})")
+
+        samples: list[RuntimeInfo] = []
+        answers: list[str] = []
         for _ in range(self.times):
-            runtime, execution = self.run_command(self.command)
-            runtimes.append(runtime)
-            executions.append(execution)
+            sample, answers = self.run_command(self.command)
+            samples.append(sample)
+
+        runtime_info = self.mean(samples, None)
+        if self.result is not None:
+            self.result.put(runtime_info, answers)
+        return runtime_info
 
+    def measure(self, benchmark: Benchmark) -> RuntimeInfo:
+        self.log(f"Benchmarking {self.day.dir()} with {self.name}")
+
+        for _ in range(benchmark.warmup):
+            self.run_command(self.command)
+
+        samples: list[RuntimeInfo] = []
+        runtimes: list[float] = []
+        while not benchmark.done(runtimes):
+            sample, _ = self.run_command(self.command)
+            samples.append(sample)
+            runtimes.append(sample.runtime)
+
+        return self.mean(samples, Stats.new(runtimes))
+
+    def mean(self, samples: list[RuntimeInfo], stats: Stats | None) -> RuntimeInfo:
+        phases = [sample.phases for sample in samples if sample.phases is not None]
         return RuntimeInfo(
             day=self.day,
             language=self.name,
-            runtime=sum(runtimes) / self.times,
-            execution=sum(executions) / self.times,
+            runtime=statistics.fmean([sample.runtime for sample in samples]),
+            execution=statistics.fmean([sample.execution for sample in samples]),
+            stats=stats,
+            phases=Phases.mean(phases) if len(phases) == len(samples) else None,
         )
 
-    def run_command(self, command: list[str]) -> tuple[float, float]:
-        start = time.time_ns()
+    def run_command(self, command: list[str]) -> tuple[RuntimeInfo, list[str]]:
+        start = time.perf_counter_ns()
         result = self.executor.run(command)
-        execution_ns = float(time.time_ns() - start)
+        execution_ns = float(time.perf_counter_ns() - start)
 
         problems = LanguageRunner.PROBLEMS.get(int(self.day.year))
         assert "Part 1:" in result, "Must have answer to part 1"
@@ -62,7 +111,22 @@ class LanguageRunner:
         assert len(matches) == 1, "Could not find runtime in output"
         runtime_ns = float(matches[0])
 
-        return (runtime_ns / 1_000_000, execution_ns / 1_000_000)
+        # only reported by languages that time each phase, see: aoc.answer
+        phases: list[str] = re.findall(r".*Phases \(ns\): (.*)", result)
+        assert len(phases) <= 1, "Found multiple phase breakdowns in output"
+
+        runtime_info = RuntimeInfo(
+            day=self.day,
+            language=self.name,
+            runtime=runtime_ns / 1_000_000,
+            execution=execution_ns / 1_000_000,
+            phases=Phases.new(phases[0]) if len(phases) == 1 else None,
+        )
+        answers: list[str] = re.findall(r"Part \d+: .*", result)
+        return runtime_info, answers
+
+    def log(self, message: str) -> None:
+        print(f"{self.executor.prefix}{message}")
 
 
 @dataclass(frozen=True)
@@ -72,44 +136,148 @@ class Runner:
     slow: int
     args: list[str]
     save: bool
+    batch: bool
+    jobs: int
+    isolate: bool
+    benchmark: Benchmark | None
+    force: bool
+    record: bool
+    baseline: str | None
+    regression: Regression | None
+    shard: Shard | None
+    weighted: bool
 
     def info(self) -> dict[str, Any]:
         return dict(
-            executions=[runner.as_dict() for runner in self.runners()],
+            executions=[runner.as_dict() for runner in self.runners(None)],
             slow=self.slow,
             save=self.save,
+            batch=self.batch,
+            jobs=self.jobs,
+            isolate=self.isolate,
+            benchmark=None if self.benchmark is None else asdict(self.benchmark),
+            force=self.force,
+            record=self.record,
+            baseline=self.baseline,
+            regression=None if self.regression is None else self.regression.percent,
+            shard=None if self.shard is None else str(self.shard),
+            weighted=self.weighted,
         )
 
     def run(self) -> None:
+        if self.baseline is None:
+            previous = History("all").load(False)
+        else:
+            previous = Database().baseline(self.baseline)
+
         start = time.time()
-        runtimes = [runner.execute() for runner in self.runners()]
+        worker = Worker(Python().worker()) if self.batch else None
+        runtimes = self.execute(self.runners(worker), previous)
+        if worker is not None:
+            worker.close()
         overall_runtime = time.time() - start
 
         slow = list(filter(lambda runtime: runtime.runtime > self.slow, runtimes))
-        previous = History("all").load(False)
         Displayer("all", runtimes, previous).display()
         Displayer("slow", slow, previous).display()
 
+        if self.regression is not None:
+            regressions = self.regression.find(runtimes, previous)
+            self.regression.report(regressions)
+            # regressed runtimes should not become the new baseline
+            if len(regressions) > 0:
+                exit(1)
+
         if self.save:
             History("all").save(runtimes)
             History("slow").save(slow)
+        if self.shard is not None:
+            ShardHistory(self.shard).save(runtimes)
+        if self.save or self.record:
+            Database().append(runtimes)
 
         print(f"Overall runtime: {overall_runtime:.3f} seconds")
 
-    def runners(self) -> list[LanguageRunner]:
-        executor = Executor()
-        result: list[LanguageRunner] = []
+    def execute(
+        self, runners: list[LanguageRunner], previous: list[RuntimeInfo]
+    ) -> list[RuntimeInfo]:
+        if self.jobs == 1:
+            return [runner.execute() for runner in runners]
+
+        # previously slow days are the most timing sensitive, when isolating these
+        # are run one at a time after everything else so they get a quiet machine
+        sensitive: set[tuple[Day, str]] = set()
+        if self.isolate:
+            for runtime in previous:
+                if runtime.runtime > self.slow:
+                    sensitive.add((runtime.day, runtime.language))
+
+        parallel: list[int] = []
+        serial: list[int] = []
+        for i, runner in enumerate(runners):
+            if (runner.day, runner.name) in sensitive:
+                serial.append(i)
+            else:
+                parallel.append(i)
+
+        results: dict[int, RuntimeInfo] = dict()
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            infos = pool.map(lambda i: runners[i].execute(), parallel)
+            results.update(zip(parallel, infos))
+        for i in serial:
+            results[i] = runners[i].execute()
+        return [results[i] for i in range(len(runners))]
+
+    def runners(self, worker: Worker | None) -> list[LanguageRunner]:
+        artifacts = Artifacts.load()
+        # results are only reused when just displayed, anything that stores runtimes
+        # or compares them against a baseline needs fresh measurements
+        cache = not (
+            self.force
+            or self.save
+            or self.record
+            or self.benchmark is not None
+            or self.regression is not None
+            or self.shard is not None
+        )
+        pairs: list[tuple[Day, Language]] = []
         for day in self.days:
             for language in self.language_strategy.get(day):
-                # 2023/25 is written in a randomized implementation
-                # Average of multiple runs is more representative
-                times = 10 if day == Day("2023", "25") else 1
-                runner = LanguageRunner(
-                    day=day,
-                    name=language.name,
-                    times=times,
-                    command=language.run(day, self.args),
-                    executor=executor,
-                )
-                result.append(runner)
+                pairs.append((day, language))
+        if self.shard is not None:
+            pairs = self.shard.select(pairs, self.weights(pairs))
+
+        result: list[LanguageRunner] = []
+        for day, language in pairs:
+            # 2023/25 is written in a randomized implementation
+            # Average of multiple runs is more representative
+            times = 10 if day == Day("2023", "25") else 1
+            # parallel output interleaves, so label every line with where it is from
+            prefix = f"[{day.dir()} {language.name}] " if self.jobs > 1 else ""
+            # python days can share a single process rather than each paying
+            # for interpreter startup & library imports
+            executor: Executor | Worker = Executor(prefix=prefix)
+            if worker is not None and isinstance(language, Python):
+                executor = worker.prefixed(prefix)
+            runner = LanguageRunner(
+                day=day,
+                name=language.name,
+                times=times,
+                command=artifacts.command(language, day, self.args),
+                executor=executor,
+                benchmark=self.benchmark,
+                result=Result.new(language, day, self.args) if cache else None,
+            )
+            result.append(runner)
         return result
+
+    def weights(self, pairs: list[tuple[Day, Language]]) -> list[float]:
+        if not self.weighted:
+            return [1.0] * len(pairs)
+        # execution rather than runtime, startup is still time a shard spends
+        previous: dict[tuple[Day, str], float] = dict()
+        for runtime in History("all").load(False):
+            previous[(runtime.day, runtime.language)] = runtime.execution
+        # days that never ran before are assumed to take a typical amount of time
+        default = statistics.mean(previous.values()) if len(previous) > 0 else 1.0
+        return [previous.get((day, language.name), default) for day, language in pairs]
@@ -0,0 +1,113 @@
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import ClassVar, Final, Self
+
+from component.command import Executor
+from language.language import Language
+from pojo.artifact import Artifact
+from pojo.day import Day
+
+
+@dataclass(frozen=True)
+class Artifacts:
+    """
+    Prebuilt executables of compiled languages, each recorded along with a hash of the
+    sources it was built from. An executable is only run while its sources still hash
+    the same, otherwise the run command of the language is used which compiles first.
+    """
+
+    FILE: ClassVar[Final] = Path(".build/artifacts.json")
+
+    hashes: dict[str, str]
+
+    @classmethod
+    def load(cls) -> Self:
+        if not Artifacts.FILE.is_file():
+            return cls(dict())
+        return cls(json.loads(Artifacts.FILE.read_text()))
+
+    def save(self) -> None:
+        Artifacts.FILE.parent.mkdir(parents=True, exist_ok=True)
+        Artifacts.FILE.write_text(json.dumps(self.hashes, indent=2, sort_keys=True))
+
+    def build(self, language: Language, executor: Executor) -> None:
+        for day in Artifacts.days(language):
+            artifact = language.artifact(day)
+            if artifact is None:
+                return
+            key, digest = Artifacts.key(language, day), Artifacts.digest(artifact)
+            if self.hashes.get(key) == digest and artifact.executable.is_file():
+                continue
+            artifact.executable.parent.mkdir(parents=True, exist_ok=True)
+            [executor.run(command) for command in artifact.build]
+            if artifact.executable.is_file():
+                self.hashes[key] = digest
+
+    def command(self, language: Language, day: Day, args: list[str]) -> list[str]:
+        artifact = language.artifact(day)
+        if artifact is None or not artifact.executable.is_file():
+            return language.run(day, args)
+        if self.hashes.get(Artifacts.key(language, day)) != Artifacts.digest(artifact):
+            return language.run(day, args)
+        return [str(artifact.executable)] + args
+
+    @staticmethod
+    def days(language: Language) -> list[Day]:
+        paths = Path().glob(f"[0-9][0-9][0-9][0-9]/[0-9][0-9]/{language.file}")
+        return sorted([Day(path.parts[0], path.parts[1]) for path in paths])
+
+    @staticmethod
+    def key(language: Language, day: Day) -> str:
+        return f"{language.name}/{day.year}/{day.day}"
+
+    @staticmethod
+    def digest(artifact: Artifact) -> str:
+        return hash_paths(artifact.sources)
+
+
+def hash_paths(paths: Iterable[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path).encode())
+        digest.update(hash_path(path).encode())
+    return digest.hexdigest()
+
+
+@cache
+def hash_path(path: Path) -> str:
+    # shared library sources are hashed once per process rather than once per day
+    digest = hashlib.sha256()
+    for file in files(path):
+        if file.is_file():
+            digest.update(str(file).encode())
+            digest.update(hash_file(file).encode())
+    return digest.hexdigest()
+
+
+@cache
+def files(path: Path) -> list[Path]:
+    if not path.is_dir():
+        return [path]
+    # only files git would track, so caches & build outputs do not change the hash,
+    # listed from within the directory so paths inside submodules work as well
+    command = ["git", "-C", str(path), "ls-files", "--cached", "--others"]
+    output = Executor(False).run(command + ["--exclude-standard"])
+    return sorted([path / file for file in output.splitlines()])
+
+
+@cache
+def hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def forget() -> None:
+    """
+    Drops every cached hash, building can change sources that were already hashed.
+    """
+    hash_path.cache_clear()
+    files.cache_clear()
+    hash_file.cache_clear()
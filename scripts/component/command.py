@@ -1,6 +1,8 @@
+import json
 import os
 import subprocess
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 env = os.environ.copy()
@@ -11,6 +13,7 @@ env["CLICOLOR_FORCE"] = "1"
 @dataclass(frozen=True)
 class Executor:
     output: bool = True
+    prefix: str = ""
 
     def call(self, args: list[str], cwd: Path | None = None) -> None:
         subprocess.run(args, cwd=cwd, check=True)
@@ -29,5 +32,73 @@ class Executor:
     def tee(self, value: str) -> str:
         value = value.strip()
         if self.output and len(value) > 0:
-            print(value)
+            lines = [self.prefix + line for line in value.splitlines()]
+            print("\n".join(lines))
+        return value
+
+
+@dataclass
+class Worker:
+    """
+    Runs solver commands of the form [interpreter, solver, *args] inside a long lived
+    process started from command, see: lib/python/aoc/worker.py. Each calling thread
+    gets its own process so parallel runs do not interleave requests.
+    """
+
+    command: list[str]
+    output: bool = True
+    prefix: str = ""
+    processes: dict[int, subprocess.Popen[str]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def prefixed(self, prefix: str) -> "Worker":
+        # shares processes & lock with this worker, only output is labeled differently
+        return replace(self, prefix=prefix)
+
+    def run(self, args: list[str]) -> str:
+        if len(args) == 0:
+            return ""
+
+        process = self.start()
+        assert process.stdin is not None and process.stdout is not None
+        request = dict(solver=args[1], args=args[2:])
+        process.stdin.write(json.dumps(request) + "\n")
+        process.stdin.flush()
+
+        line = process.stdout.readline()
+        if len(line) == 0:
+            exit(1)
+        response = json.loads(line)
+        output = self.tee(response["output"])
+        if response["error"] is not None:
+            self.tee(response["error"])
+            exit(1)
+        return output
+
+    def start(self) -> subprocess.Popen[str]:
+        thread = threading.get_ident()
+        with self.lock:
+            if thread not in self.processes:
+                self.processes[thread] = subprocess.Popen(
+                    self.command,
+                    env=env,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+            return self.processes[thread]
+
+    def close(self) -> None:
+        with self.lock:
+            for process in self.processes.values():
+                assert process.stdin is not None
+                process.stdin.close()
+                process.wait()
+            self.processes.clear()
+
+    def tee(self, value: str) -> str:
+        value = value.strip()
+        if self.output and len(value) > 0:
+            lines = [self.prefix + line for line in value.splitlines()]
+            print("\n".join(lines))
         return value
@@ -0,0 +1,155 @@
+import hashlib
+import os
+import platform
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ClassVar, Final
+
+from component.command import Executor
+from pojo.runtime_info import RuntimeInfo
+
+
+@dataclass(frozen=True)
+class Database:
+    """
+    Append only store of every recorded run, unlike History which only keeps the last
+    one. Each run is keyed by the git commit it ran against and a fingerprint of the
+    machine it ran on so baselines are only ever compared on the same hardware.
+    """
+
+    FILE: ClassVar[Final] = Path("history.db")
+    STATS: ClassVar[Final] = ["runs", "min", "median", "p95", "ci"]
+
+    def append(self, runtimes: list[RuntimeInfo]) -> None:
+        if len(runtimes) == 0:
+            return
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (created, git, dirty, machine) VALUES (?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(),
+                    Database.commit("HEAD"),
+                    Database.dirty(),
+                    Database.machine(),
+                ),
+            )
+            rows = [(cursor.lastrowid, runtime.as_dict()) for runtime in runtimes]
+            connection.executemany(
+                """
+                INSERT INTO runtimes (
+                    run, year, day, language, runtime, execution,
+                    runs, min, median, p95, ci
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    [run] + [value.get(key) for key in Database.columns()]
+                    for run, value in rows
+                ],
+            )
+
+    def baseline(self, ref: str | None) -> list[RuntimeInfo]:
+        """
+        Latest recorded runtime of each day & language on this machine, optionally
+        limited to runs against the commit that ref resolves to.
+        """
+        query = """
+            SELECT runtimes.* FROM runtimes
+            JOIN runs ON runs.id = runtimes.run
+            WHERE runs.machine = ? AND (? IS NULL OR runs.git = ?)
+            ORDER BY runs.id
+        """
+        commit = None if ref is None else Database.commit(ref)
+        latest: dict[tuple[int, int, str], RuntimeInfo] = dict()
+        for row in self.query(query, (Database.machine(), commit, commit)):
+            runtime = RuntimeInfo.from_dict(row)
+            latest[(row["year"], row["day"], row["language"])] = runtime
+        return list(latest.values())
+
+    def series(self) -> list[dict[str, Any]]:
+        """
+        Every recorded runtime on this machine along with when & where it ran.
+        """
+        query = """
+            SELECT runs.created, runs.git, runtimes.* FROM runtimes
+            JOIN runs ON runs.id = runtimes.run
+            WHERE runs.machine = ?
+            ORDER BY runs.id
+        """
+        return self.query(query, (Database.machine(),))
+
+    def query(self, query: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        if not Database.FILE.is_file():
+            return []
+        with self.connect() as connection:
+            connection.row_factory = sqlite3.Row
+            rows = connection.execute(query, params).fetchall()
+        result: list[dict[str, Any]] = []
+        for row in rows:
+            # stats are only present for benchmarked runs
+            value = {key: row[key] for key in row.keys() if row[key] is not None}
+            result.append(value)
+        return result
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(Database.FILE)
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY,
+                created TEXT NOT NULL,
+                git TEXT NOT NULL,
+                dirty INTEGER NOT NULL,
+                machine TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runtimes (
+                run INTEGER NOT NULL REFERENCES runs (id),
+                year INTEGER NOT NULL,
+                day INTEGER NOT NULL,
+                language TEXT NOT NULL,
+                runtime REAL NOT NULL,
+                execution REAL NOT NULL,
+                runs INTEGER,
+                min REAL,
+                median REAL,
+                p95 REAL,
+                ci REAL
+            );
+            CREATE INDEX IF NOT EXISTS runtimes_key
+            ON runtimes (year, day, language);
+            """
+        )
+        try:
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    @staticmethod
+    def columns() -> list[str]:
+        return ["year", "day", "language", "runtime", "execution"] + Database.STATS
+
+    @staticmethod
+    def commit(ref: str) -> str:
+        return Executor(False).run(["git", "rev-parse", ref])
+
+    @staticmethod
+    def dirty() -> bool:
+        # untracked files, like this database itself, do not change any solution
+        command = ["git", "status", "--porcelain", "--untracked-files=no"]
+        return len(Executor(False).run(command)) > 0
+
+    @staticmethod
+    def machine() -> str:
+        parts = [
+            platform.node(),
+            platform.system(),
+            platform.machine(),
+            platform.processor(),
+            str(os.cpu_count()),
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:12]
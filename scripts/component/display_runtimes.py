@@ -23,13 +23,22 @@ class Column:
     name: str
     default: str | None
     colors: list[Color]
+    noise: str | None
     width: int
     total: float
 
-    def __init__(self, name: str, default: str | None, colors: list[Color]) -> None:
+    def __init__(
+        self,
+        name: str,
+        default: str | None,
+        colors: list[Color],
+        noise: str | None = None,
+    ) -> None:
         self.name = name
         self.default = default
         self.colors = colors
+        # name of the value within which changes are considered noise
+        self.noise = noise
         self.width = len(name)
         self.total = 0
 
@@ -44,16 +53,18 @@ class Column:
             self.total = round(self.total + value, 3)
         self.width = max(self.width, len(str(value)), len(str(self.total)))
 
-    def cell(self, value: Any) -> str:
+    def cell(self, value: Any, runtime: dict[str, Any]) -> str:
         result = f" {str(value).ljust(self.width)} "
-        color = self.color(value)
+        color = self.color(value, runtime)
         if color is not None:
             result = color.wrap(result)
         return result
 
-    def color(self, value: Any) -> Color | None:
+    def color(self, value: Any, runtime: dict[str, Any]) -> Color | None:
         if not isinstance(value, float) or value == self.total:
             return None
+        if self.noise is not None and abs(value) <= runtime.get(self.noise, 0):
+            return None
         for color in self.colors:
             if color.contains(value):
                 return color
@@ -84,18 +95,18 @@ class Schema:
         return left + center.join(sections) + right
 
     def heading(self) -> str:
-        return self.row([column.name for column in self.columns])
+        return self.row([column.name for column in self.columns], dict())
 
     def runtime(self, runtime: dict[str, Any]) -> str:
-        return self.row([column.get(runtime) for column in self.columns])
+        return self.row([column.get(runtime) for column in self.columns], runtime)
 
     def total(self) -> str:
-        return self.row([column.total for column in self.columns])
+        return self.row([column.total for column in self.columns], dict())
 
-    def row(self, values: list[Any]) -> str:
+    def row(self, values: list[Any], runtime: dict[str, Any]) -> str:
         line: list[str] = []
         for column, value in zip(self.columns, values):
-            line.append(column.cell(value))
+            line.append(column.cell(value, runtime))
         return "│" + "│".join(line) + "│"
 
 
@@ -126,8 +137,28 @@ class Displayer:
             Column("execution", None, []),
             Column("runtime", None, time),
             Column("previous", "none", time),
-            Column("delta", "none", change),
+            Column("delta", "none", change, "ci"),
         )
+        if any([info.stats is not None for info in self.current]):
+            schema.columns.extend(
+                [
+                    Column("runs", "none", []),
+                    Column("min", "none", []),
+                    Column("median", "none", []),
+                    Column("p95", "none", []),
+                    Column("ci", "none", []),
+                ]
+            )
+        if any([info.cached for info in self.current]):
+            schema.columns.append(Column("cached", "no", []))
+        if any([info.phases is not None for info in self.current]):
+            schema.columns.extend(
+                [
+                    Column("parse", "none", time),
+                    Column("part1", "none", time),
+                    Column("part2", "none", time),
+                ]
+            )
 
         previous_days: dict[Day, float] = dict()
         for runtime in self.previous:
@@ -136,6 +167,8 @@ class Displayer:
         runtimes: list[dict[str, Any]] = []
         for info in self.current:
             runtime = info.as_dict()
+            if info.cached:
+                runtime["cached"] = "yes"
             previous = previous_days.get(info.day)
             if previous is not None:
                 runtime["previous"] = round(previous, 3)
@@ -1,9 +1,13 @@
 import json
+import platform
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import Any, ClassVar, Final, Literal
 
+from component.database import Database
 from pojo.runtime_info import RuntimeInfo
+from pojo.shard import Shard
 
 
 @dataclass(frozen=True)
@@ -11,8 +15,10 @@ class History:
     name: Literal["all", "slow"]
 
     def save(self, runtimes: list[RuntimeInfo]) -> None:
+        self.write([runtime.as_dict() for runtime in runtimes])
+
+    def write(self, value: list[dict[str, Any]]) -> None:
         with open(f"{self.name}.json", "w") as f:
-            value = [runtime.as_dict() for runtime in runtimes]
             f.write(json.dumps(value))
 
     def load(self, fail: bool) -> list[RuntimeInfo]:
@@ -28,3 +34,31 @@ class History:
             runtime_info = RuntimeInfo.from_dict(runtime)
             runtimes.append(runtime_info)
         return runtimes
+
+
+@dataclass(frozen=True)
+class ShardHistory:
+    """
+    Runtimes of a single shard along with the commit & machine they ran on. Each
+    machine writes its own file, which get merged back into History once all of
+    the shards are done.
+    """
+
+    DIR: ClassVar[Final] = Path("shards")
+
+    shard: Shard
+
+    def file(self) -> Path:
+        return ShardHistory.DIR / f"{self.shard.index}-of-{self.shard.count}.json"
+
+    def save(self, runtimes: list[RuntimeInfo]) -> None:
+        value = dict(
+            shard=str(self.shard),
+            created=datetime.now(timezone.utc).isoformat(),
+            git=Database.commit("HEAD"),
+            machine=Database.machine(),
+            node=platform.node(),
+            runtimes=[runtime.as_dict() for runtime in runtimes],
+        )
+        self.file().parent.mkdir(parents=True, exist_ok=True)
+        self.file().write_text(json.dumps(value, indent=2))
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import ClassVar, Final
+
+from pojo.day import Day
+from pojo.runtime_info import RuntimeInfo
+
+
+@dataclass(frozen=True)
+class Regression:
+    # changes below this many milliseconds are noise regardless of percentage
+    MIN_DELTA: ClassVar[Final] = 1.0
+
+    percent: float
+
+    def find(
+        self, current: list[RuntimeInfo], previous: list[RuntimeInfo]
+    ) -> list[tuple[RuntimeInfo, RuntimeInfo]]:
+        baseline: dict[tuple[Day, str], RuntimeInfo] = dict()
+        for runtime in previous:
+            baseline[(runtime.day, runtime.language)] = runtime
+
+        result: list[tuple[RuntimeInfo, RuntimeInfo]] = []
+        for runtime in current:
+            before = baseline.get((runtime.day, runtime.language))
+            if before is not None and self.regressed(runtime, before):
+                result.append((runtime, before))
+        return result
+
+    def regressed(self, current: RuntimeInfo, previous: RuntimeInfo) -> bool:
+        delta = current.runtime - previous.runtime
+        if delta <= previous.runtime * self.percent / 100:
+            return False
+        # benchmarked runs know their own noise, stay within both intervals
+        noise = Regression.MIN_DELTA
+        for runtime in [current, previous]:
+            if runtime.stats is not None:
+                noise = max(noise, runtime.stats.ci)
+        return delta > noise
+
+    def report(self, regressions: list[tuple[RuntimeInfo, RuntimeInfo]]) -> None:
+        print(f"REGRESSIONS (> {self.percent}%): {len(regressions)}")
+        for current, previous in regressions:
+            delta = current.runtime - previous.runtime
+            # runtimes are stored rounded, so very fast days can have a baseline of 0
+            percent = (
+                "n/a"
+                if previous.runtime == 0
+                else f"+{100 * delta / previous.runtime:.1f}%"
+            )
+            print(
+                f"  {current.day.dir()} {current.language}: "
+                f"{previous.runtime:.3f} -> {current.runtime:.3f} ms "
+                f"(+{delta:.3f} ms, {percent})"
+            )
@@ -0,0 +1,68 @@
+import hashlib
+import json
+import subprocess
+from dataclasses import dataclass, replace
+from functools import cache
+from pathlib import Path
+from typing import ClassVar, Final, Self
+
+from component.artifacts import hash_paths
+from language.language import Language
+from pojo.day import Day
+from pojo.runtime_info import RuntimeInfo
+
+
+@dataclass(frozen=True)
+class Result:
+    """
+    Answers and runtime of a successful run, stored under a hash of everything that
+    could change them: the day's sources, its language library, the inputs, the
+    toolchain version and the arguments. An edit to any of these changes the key so
+    stale results are never read, they simply stop being looked up.
+    """
+
+    DIR: ClassVar[Final] = Path(".build/results")
+
+    file: Path
+
+    @classmethod
+    def new(cls, language: Language, day: Day, args: list[str]) -> Self:
+        # whole directories, days can have helper sources & more than one input
+        paths = [
+            day.dir(),
+            Path("lib") / language.name,
+            Path("data") / day.year / day.day,
+        ]
+        value = dict(
+            language=language.name,
+            sources=hash_paths(paths),
+            toolchain=toolchain(language.cmd),
+            args=args,
+        )
+        key = hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+        return cls(Result.DIR / f"{key}.json")
+
+    def get(self) -> tuple[RuntimeInfo, list[str]] | None:
+        if not self.file.is_file():
+            return None
+        value = json.loads(self.file.read_text())
+        runtime = replace(RuntimeInfo.from_dict(value["runtime"]), cached=True)
+        return runtime, value["answers"]
+
+    def put(self, runtime: RuntimeInfo, answers: list[str]) -> None:
+        value = dict(runtime=runtime.as_dict(), answers=answers)
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.file.write_text(json.dumps(value, indent=2))
+
+
+@cache
+def toolchain(cmd: str) -> str:
+    # most toolchains take --version, go & zig use a version subcommand instead
+    for flag in ["--version", "version"]:
+        try:
+            result = subprocess.run([cmd, flag], capture_output=True, text=True)
+        except FileNotFoundError:
+            return ""
+        if result.returncode == 0:
+            return (result.stdout + result.stderr).strip()
+    return ""
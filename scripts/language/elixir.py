@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from component.command import Executor
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -20,6 +21,10 @@ class Elixir:
     def run(self, day: Day, args: list[str]) -> list[str]:
         return ["mix", "solve", day.year, day.day] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # runs within the mix project
+        return None
+
     def setup(self, day: Day) -> None:
         module = f"Y{day.year}.D{day.day}"
         solution = day.dir() / self.file
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from pathlib import Path
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -20,6 +22,15 @@ class Go:
         solution = day.dir() / self.file
         return ["go", "run", str(solution)] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        solution = day.dir() / self.file
+        executable = Path(".build/go") / f"{day.year}_{day.day}"
+        return Artifact(
+            executable=executable,
+            sources=[solution, Path("lib/go"), Path("go.mod"), Path("go.sum")],
+            build=[["go", "build", "-o", str(executable), str(solution)]],
+        )
+
     def setup(self, day: Day) -> None:
         # no additional setup
         pass
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -22,6 +23,10 @@ class Java:
         args = [] if len(args) == 0 else [f'--args="{" ".join(args)}"']
         return ["./gradlew", f":{task}:run", "-q"] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # runs through gradle
+        return None
+
     def setup(self, day: Day) -> None:
         f = open("settings.gradle.kts", "a")
         f.write("\n")
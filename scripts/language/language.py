@@ -1,5 +1,6 @@
 from typing import Protocol
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -19,4 +20,6 @@ class Language(Protocol):
 
     def run(self, day: Day, args: list[str]) -> list[str]: ...
 
+    def artifact(self, day: Day) -> Artifact | None: ...
+
     def setup(self, day: Day) -> None: ...
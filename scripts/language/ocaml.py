@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from component.command import Executor
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -23,6 +24,10 @@ class Ocaml:
         binary = Ocaml.binary(day)
         return ["dune", "exec", "--profile", "release", "--", binary] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # runs through dune exec
+        return None
+
     def setup(self, day: Day) -> None:
         binary = Ocaml.binary(day)
         dune = day.dir() / "dune"
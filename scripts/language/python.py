@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import ClassVar, Final
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -24,6 +25,13 @@ class Python:
         solution = day.dir() / self.file
         return ["python", str(solution)] + args
 
+    def worker(self) -> list[str]:
+        return ["python", "-m", "aoc.worker"]
+
+    def artifact(self, day: Day) -> Artifact | None:
+        # interpreted, nothing to build
+        return None
+
     def setup(self, day: Day) -> None:
         # no additional setup
         pass
@@ -4,6 +4,7 @@ from pathlib import Path
 import tomlkit
 from tomlkit.items import AoT
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -26,6 +27,14 @@ class Rust:
         args = [] if len(args) == 0 else ["--"] + args
         return ["cargo", "run", "-rq", "--bin", binary] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # every binary is compiled by cargo build --bins
+        return Artifact(
+            executable=Path("target/release") / Rust.binary(day),
+            sources=[day.dir() / self.file, Path("lib/rust"), Path("Cargo.toml")],
+            build=[],
+        )
+
     def setup(self, day: Day) -> None:
         config = tomlkit.table()
         config["name"] = Rust.binary(day)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -22,6 +23,10 @@ class TypeScript:
         solution = day.dir() / self.file
         return ["bun", "run", str(solution)] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # interpreted, nothing to build
+        return None
+
     def setup(self, day: Day) -> None:
         # no additional setup
         pass
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from pojo.artifact import Artifact
 from pojo.day import Day
 
 
@@ -23,6 +24,10 @@ class Zig:
         args = [] if len(args) == 0 else ["--"] + args
         return ["zig", "build", "-Doptimize=ReleaseSmall", binary] + args
 
+    def artifact(self, day: Day) -> Artifact | None:
+        # runs through zig build
+        return None
+
     def setup(self, day: Day) -> None:
         path = Path("build.zig")
         contents = path.read_text()
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """
+    Executable for a single day of a compiled language. An empty build means it is
+    produced by the build step of the language itself.
+    """
+
+    executable: Path
+    sources: list[Path]
+    build: list[list[str]]
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from pojo.stats import Stats
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    warmup: int = 1
+    min_runs: int = 5
+    max_runs: int = 50
+    # stop once the standard error is within this fraction of the mean
+    target: float = 0.02
+
+    def done(self, runtimes: list[float]) -> bool:
+        if len(runtimes) >= self.max_runs:
+            return True
+        if len(runtimes) < self.min_runs:
+            return False
+        return Stats.rse(runtimes) <= self.target
@@ -0,0 +1,63 @@
+import statistics
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass(frozen=True)
+class Phases:
+    """
+    Breakdown of a runtime (in ms) into parsing the input & solving each part, only
+    reported by languages whose answer library times them separately. Parts are only
+    present for solvers that time them, the last day of a year only has part 1.
+    """
+
+    parse: float
+    part1: float | None
+    part2: float | None
+
+    @classmethod
+    def new(cls, line: str) -> Self:
+        """
+        Parses output of the form: parse=1200 part1=3400 part2=5600, values in ns.
+        """
+        values: dict[str, float] = dict()
+        for entry in line.split():
+            name, ns = entry.split("=")
+            values[name] = float(ns) / 1_000_000
+        return cls(
+            parse=values["parse"],
+            part1=values.get("part1"),
+            part2=values.get("part2"),
+        )
+
+    @classmethod
+    def mean(cls, phases: list[Self]) -> Self:
+        assert len(phases) > 0, "need at least one value"
+        return cls(
+            parse=statistics.fmean([phase.parse for phase in phases]),
+            part1=Phases.optional([phase.part1 for phase in phases]),
+            part2=Phases.optional([phase.part2 for phase in phases]),
+        )
+
+    @staticmethod
+    def optional(values: list[float | None]) -> float | None:
+        present = [value for value in values if value is not None]
+        return None if len(present) < len(values) else statistics.fmean(present)
+
+    def as_dict(self) -> dict[str, Any]:
+        result = dict(parse=round(self.parse, 3))
+        if self.part1 is not None:
+            result["part1"] = round(self.part1, 3)
+        if self.part2 is not None:
+            result["part2"] = round(self.part2, 3)
+        return result
+
+    @staticmethod
+    def from_dict(value: dict[str, Any]) -> "Phases | None":
+        if "parse" not in value:
+            return None
+        return Phases(
+            parse=value["parse"],
+            part1=value.get("part1"),
+            part2=value.get("part2"),
+        )
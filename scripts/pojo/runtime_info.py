@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Any
 
 from pojo.day import Day
+from pojo.phases import Phases
+from pojo.stats import Stats
 
 
 @dataclass(frozen=True)
@@ -10,15 +12,24 @@ class RuntimeInfo:
     language: str
     runtime: float
     execution: float
+    stats: Stats | None = None
+    phases: Phases | None = None
+    # reused from an earlier run rather than measured, never stored as such
+    cached: bool = False
 
     def as_dict(self) -> dict[str, Any]:
-        return dict(
+        result = dict(
             year=int(self.day.year),
             day=int(self.day.day),
             language=self.language,
             runtime=round(self.runtime, 3),
             execution=round(self.execution, 3),
         )
+        if self.stats is not None:
+            result.update(self.stats.as_dict())
+        if self.phases is not None:
+            result.update(self.phases.as_dict())
+        return result
 
     @staticmethod
     def from_dict(value: dict[str, Any]) -> "RuntimeInfo":
@@ -30,4 +41,6 @@ class RuntimeInfo:
             language=value["language"],
             runtime=value["runtime"],
             execution=value["execution"],
+            stats=Stats.from_dict(value),
+            phases=Phases.from_dict(value),
         )
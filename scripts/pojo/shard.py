@@ -0,0 +1,40 @@
+import heapq
+from dataclasses import dataclass
+from typing import Self
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    One of count disjoint slices of a run, numbered from 1 so shards 1/n through n/n
+    together cover every item exactly once. The partition only depends on the order
+    and weights of the items, so separate machines all agree on it.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        assert 1 <= self.index <= self.count, "shard must be between 1 & count"
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        index, count = value.split("/")
+        return cls(int(index), int(count))
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    def select[T](self, items: list[T], weights: list[float]) -> list[T]:
+        """
+        Longest processing time first, the heaviest remaining item goes to the least
+        loaded shard. Ties are broken by position, so with equal weights this deals
+        items out round robin.
+        """
+        loads = [(0.0, shard) for shard in range(self.count)]
+        owners = [0] * len(items)
+        for i in sorted(range(len(items)), key=lambda i: (-weights[i], i)):
+            load, shard = heapq.heappop(loads)
+            owners[i] = shard
+            heapq.heappush(loads, (load + weights[i], shard))
+        return [item for item, owner in zip(items, owners) if owner == self.index - 1]
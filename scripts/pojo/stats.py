@@ -0,0 +1,64 @@
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Any, Self
+
+
+@dataclass(frozen=True)
+class Stats:
+    runs: int
+    min: float
+    median: float
+    p95: float
+    # half width of the 95% confidence interval around the mean
+    ci: float
+
+    @classmethod
+    def new(cls, values: list[float]) -> Self:
+        assert len(values) > 0, "need at least one value"
+        ordered = sorted(values)
+        # nearest rank percentile
+        p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+        return cls(
+            runs=len(values),
+            min=ordered[0],
+            median=statistics.median(ordered),
+            p95=p95,
+            ci=Stats.z() * Stats.sem(values),
+        )
+
+    @staticmethod
+    def z() -> float:
+        return statistics.NormalDist().inv_cdf(0.975)
+
+    @staticmethod
+    def sem(values: list[float]) -> float:
+        if len(values) < 2:
+            return 0.0
+        return statistics.stdev(values) / math.sqrt(len(values))
+
+    @staticmethod
+    def rse(values: list[float]) -> float:
+        mean = statistics.fmean(values)
+        return 0.0 if mean == 0 else Stats.sem(values) / mean
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(
+            runs=self.runs,
+            min=round(self.min, 3),
+            median=round(self.median, 3),
+            p95=round(self.p95, 3),
+            ci=round(self.ci, 3),
+        )
+
+    @staticmethod
+    def from_dict(value: dict[str, Any]) -> "Stats | None":
+        if "ci" not in value:
+            return None
+        return Stats(
+            runs=value["runs"],
+            min=value["min"],
+            median=value["median"],
+            p95=value["p95"],
+            ci=value["ci"],
+        )
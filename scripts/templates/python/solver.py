@@ -6,8 +6,10 @@ from aoc.parser import Parser
 def main() -> None:
     data = Parser().string()
     print(data)
-    answer.part1(1, 1)
-    answer.part2(1, 1)
+    with answer.phase(1):
+        answer.part1(1, 1)
+    with answer.phase(2):
+        answer.part2(1, 1)
 
 
 if __name__ == "__main__":